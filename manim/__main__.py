@@ -10,6 +10,7 @@ import types
 
 from .config import file_writer_config, args
 from .utils import cfg_subcmds
+from .utils import cache_subcmds
 from .scene.scene import Scene
 from .utils.sounds import play_error_sound
 from .utils.sounds import play_finish_sound
@@ -156,6 +157,15 @@ def main():
                     cfg_subcmds.export(args.dir)
             else:
                 logger.error("No argument provided; Exiting...")
+        elif "cache" in args.subcommands:
+            if args.cache_subcommand is not None:
+                subcommand = args.cache_subcommand
+                if subcommand == "stats":
+                    cache_subcmds.stats()
+                elif subcommand == "prune":
+                    cache_subcmds.prune(args.max_size)
+            else:
+                logger.error("No argument provided; Exiting...")
 
     else:
         module = get_module(file_writer_config["input_file"])
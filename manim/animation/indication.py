@@ -238,6 +238,7 @@ class WiggleOutThenIn(Animation):
 
     def interpolate_submobject(self, submobject, starting_sumobject, alpha):
         submobject.points[:, :] = starting_sumobject.points
+        submobject.note_changed_points()
         submobject.scale(
             interpolate(1, self.scale_value, there_and_back(alpha)),
             about_point=self.get_scale_about_point(),
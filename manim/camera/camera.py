@@ -3,9 +3,9 @@ import itertools as it
 import operator as op
 import time
 import copy
+import weakref
 
 from PIL import Image
-from scipy.spatial.distance import pdist
 import cairo
 import numpy as np
 
@@ -16,6 +16,7 @@ from ..mobject.types.image_mobject import AbstractImageMobject
 from ..mobject.mobject import Mobject
 from ..mobject.types.point_cloud_mobject import PMobject
 from ..mobject.types.vectorized_mobject import VMobject
+from ..utils.bezier import interpolate
 from ..utils.color import color_to_int_rgba
 from ..utils.config_ops import digest_config
 from ..utils.images import get_full_raster_image_path
@@ -23,7 +24,6 @@ from ..utils.iterables import batch_by_property
 from ..utils.iterables import list_difference_update
 from ..utils.iterables import remove_list_redundancies
 from ..utils.simple_functions import fdiv
-from ..utils.space_ops import angle_of_vector
 from ..utils.space_ops import get_norm
 
 
@@ -65,6 +65,15 @@ class Camera(object):
         "z_buff_func": lambda m: np.round(m.get_center()[2], 2),
         "cairo_line_width_multiple": 0.01,
         "use_z_index": True,
+        # Maximum number of pixels written at once when splatting the
+        # points of a point cloud, which bounds the memory used for it.
+        "point_cloud_chunk_size": 2 ** 18,
+        # Draft renders trade fidelity for speed: they use the antialiasing
+        # and curve flattening tolerance (in pixels) below, draw gradients
+        # with their first color and point clouds one pixel thick.
+        "draft_render": config["draft_render"],
+        "draft_antialias": cairo.ANTIALIAS_FAST,
+        "draft_tolerance": 0.5,
     }
 
     def __init__(self, background=None, **kwargs):
@@ -80,6 +89,8 @@ class Camera(object):
         digest_config(self, kwargs, locals())
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        # Gradients of each vmobject, keyed by their colors and points
+        self.vmobject_to_gradients = weakref.WeakKeyDictionary()
         self.init_background()
         self.resize_frame_shape()
         self.reset()
@@ -308,6 +319,14 @@ class Camera(object):
         convert_from_floats : bool, optional
             Whether or not to convert float values to proper RGB values, by default False
         """
+        if (
+            not convert_from_floats
+            and hasattr(self, "pixel_array")
+            and self.pixel_array.shape == np.shape(pixel_array)
+        ):
+            # Set in place, without an intermediate copy
+            self.pixel_array[:, :, :] = pixel_array
+            return
         converted_array = self.convert_pixel_array(pixel_array, convert_from_floats)
         if not (
             hasattr(self, "pixel_array")
@@ -579,6 +598,9 @@ class Camera(object):
                 (ph / 2) + fc[1] * fdiv(ph, fh),
             )
         )
+        if self.draft_render:
+            ctx.set_antialias(self.draft_antialias)
+            ctx.set_tolerance(self.draft_tolerance)
         self.cache_cairo_context(pixel_array, ctx)
         return ctx
 
@@ -617,10 +639,94 @@ class Camera(object):
             The Pixel array to add the VMobjects to.
         """
         ctx = self.get_cairo_context(pixel_array)
-        for vmobject in vmobjects:
-            self.display_vectorized(vmobject, ctx)
+        for batch in self.get_solid_style_batches(vmobjects):
+            if len(batch) == 1:
+                vmobject, points = batch[0]
+                self.display_vectorized(vmobject, ctx, points)
+                continue
+            # All of them are painted with the same single color, either
+            # only filled or only stroked, so one cairo call does
+            ctx.new_path()
+            for vmobject, points in batch:
+                self.append_cairo_context_path(ctx, vmobject, points)
+            vmobject = batch[0][0]
+            if self.get_solid_style_key(vmobject)[0] == "fill":
+                self.apply_fill(ctx, vmobject)
+            else:
+                self.apply_stroke(ctx, vmobject)
+
+    def get_solid_style_key(self, vmobject):
+        """Returns a key identifying how vmobject is painted if that is with
+        a single opaque color, and only by filling or only by stroking.
+        Otherwise returns None.
+
+        Parameters
+        ----------
+        vmobject : VMobject
+            The VMobject
+
+        Returns
+        -------
+        tuple or None
+        """
+        if vmobject.get_stroke_width(background=True) != 0:
+            return None
+        fill_rgbas = self.get_fill_rgbas(vmobject)
+        stroke_rgbas = self.get_stroke_rgbas(vmobject)
+        if len(fill_rgbas) != 1 or len(stroke_rgbas) != 1:
+            return None
+        stroke_width = vmobject.get_stroke_width()
+        fills = fill_rgbas[0, 3] != 0
+        strokes = stroke_width != 0 and stroke_rgbas[0, 3] != 0
+        if fills and not strokes and fill_rgbas[0, 3] == 1:
+            return ("fill", tuple(fill_rgbas[0]))
+        if strokes and not fills and stroke_rgbas[0, 3] == 1:
+            return ("stroke", tuple(stroke_rgbas[0]), stroke_width)
+        return None
+
+    def get_solid_style_batches(self, vmobjects):
+        """Splits vmobjects into runs of consecutive ones which can be painted
+        together, without changing how they look.
+
+        Opaque strokes of the same color can always be painted together.
+        Fills can only be when they don't overlap, as overlapping subpaths
+        of opposite orientations would leave holes under the winding rule.
+
+        Parameters
+        ----------
+        vmobjects : list
+            list of VMobjects
 
-    def display_vectorized(self, vmobject, ctx):
+        Returns
+        -------
+        list
+            list of batches, each a list of (vmobject, points) pairs, where
+            points are the vmobject's points transformed for display.
+        """
+        batches = []
+        curr_key = None
+        for vmobject in vmobjects:
+            points = self.transform_points_pre_display(vmobject, vmobject.points)
+            key = self.get_solid_style_key(vmobject) if len(points) > 0 else None
+            if key is not None and key == curr_key:
+                if key[0] == "stroke":
+                    batches[-1].append((vmobject, points))
+                    continue
+                lower = points[:, :2].min(0)
+                upper = points[:, :2].max(0)
+                if np.any(lower > batch_upper) or np.any(upper < batch_lower):
+                    batches[-1].append((vmobject, points))
+                    batch_lower = np.minimum(batch_lower, lower)
+                    batch_upper = np.maximum(batch_upper, upper)
+                    continue
+            batches.append([(vmobject, points)])
+            curr_key = key
+            if key is not None:
+                batch_lower = points[:, :2].min(0)
+                batch_upper = points[:, :2].max(0)
+        return batches
+
+    def display_vectorized(self, vmobject, ctx, points=None):
         """Displays a VMobject in the cairo context
 
         Parameters
@@ -629,19 +735,21 @@ class Camera(object):
             The Vectorized Mobject to display
         ctx : cairo.Context
             The cairo context to use.
+        points : np.ndarray, optional
+            The points of the vmobject, already transformed for display.
 
         Returns
         -------
         Camera
             The camera object
         """
-        self.set_cairo_context_path(ctx, vmobject)
+        self.set_cairo_context_path(ctx, vmobject, points)
         self.apply_stroke(ctx, vmobject, background=True)
         self.apply_fill(ctx, vmobject)
         self.apply_stroke(ctx, vmobject)
         return self
 
-    def set_cairo_context_path(self, ctx, vmobject):
+    def set_cairo_context_path(self, ctx, vmobject, points=None):
         """Sets a path for the cairo context with the vmobject passed
 
         Parameters
@@ -650,19 +758,42 @@ class Camera(object):
             The cairo context
         vmobject : VMobject
             The VMobject
+        points : np.ndarray, optional
+            The points of the vmobject, already transformed for display.
 
         Returns
         -------
         Camera
             Camera object after setting cairo_context_path
         """
-        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        if points is None:
+            points = self.transform_points_pre_display(vmobject, vmobject.points)
         # TODO, shouldn't this be handled in transform_points_pre_display?
         # points = points - self.get_frame_center()
         if len(points) == 0:
             return
 
         ctx.new_path()
+        return self.append_cairo_context_path(ctx, vmobject, points)
+
+    def append_cairo_context_path(self, ctx, vmobject, points):
+        """Adds the subpaths of the vmobject to the current path of the
+        cairo context.
+
+        Parameters
+        ----------
+        ctx : cairo.Context
+            The cairo context
+        vmobject : VMobject
+            The VMobject
+        points : np.ndarray
+            The points of the vmobject, transformed for display.
+
+        Returns
+        -------
+        Camera
+            The camera object
+        """
         subpaths = vmobject.gen_subpaths_from_points_2d(points)
         for subpath in subpaths:
             quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
@@ -692,21 +823,59 @@ class Camera(object):
         Camera
             The camera object
         """
-        if len(rgbas) == 1:
+        if len(rgbas) == 1 or self.draft_render:
             # Use reversed rgb because cairo surface is
             # encodes it in reverse order
             ctx.set_source_rgba(*rgbas[0][2::-1], rgbas[0][3])
         else:
-            points = vmobject.get_gradient_start_and_end_points()
-            points = self.transform_points_pre_display(vmobject, points)
-            pat = cairo.LinearGradient(*it.chain(*[point[:2] for point in points]))
-            step = 1.0 / (len(rgbas) - 1)
-            offsets = np.arange(0, 1 + step, step)
-            for rgba, offset in zip(rgbas, offsets):
-                pat.add_color_stop_rgba(offset, *rgba[2::-1], rgba[3])
+            # Reuse the gradient if neither the colors nor the points the
+            # endpoints are computed from changed
+            key = self.get_gradient_key(vmobject, rgbas)
+            gradients = self.vmobject_to_gradients.setdefault(vmobject, {})
+            pat = gradients.get(key) if key is not None else None
+            if pat is None:
+                points = vmobject.get_gradient_start_and_end_points()
+                points = self.transform_points_pre_display(vmobject, points)
+                pat = cairo.LinearGradient(*it.chain(*[point[:2] for point in points]))
+                offsets = np.linspace(0, 1, len(rgbas))
+                for rgba, offset in zip(rgbas, offsets):
+                    pat.add_color_stop_rgba(offset, *rgba[2::-1], rgba[3])
+                if key is not None:
+                    # The background stroke, fill and stroke each have one
+                    if len(gradients) >= 3:
+                        gradients.clear()
+                    gradients[key] = pat
             ctx.set_source(pat)
         return self
 
+    def get_gradient_key(self, vmobject, rgbas):
+        """Gets the key under which the gradient of the passed colors over
+        vmobject is cached, which changes whenever the gradient could.
+
+        Parameters
+        ----------
+        vmobject : VMobject
+            The VMobject
+        rgbas : np.ndarray
+            The RGBA array of the gradient.
+
+        Returns
+        -------
+        tuple
+            The key, or None if the gradient can't be cached.
+        """
+        transform_key = self.get_points_transform_key(vmobject)
+        if transform_key is None:
+            return None
+        return (
+            rgbas.tobytes(),
+            # The endpoints depend on the bounding box of the whole family
+            tuple((id(mob), mob.points_version) for mob in vmobject.get_family()),
+            vmobject.get_sheen_direction().tobytes(),
+            vmobject.shade_in_3d,
+            transform_key,
+        )
+
     def apply_fill(self, ctx, vmobject):
         """Fills the cairo context
 
@@ -827,10 +996,36 @@ class Camera(object):
             The camera object.
         """
         displayer = self.get_background_colored_vmobject_displayer()
+        if all(map(self.is_colored_only_by_background, cvmobjects)):
+            # Let cairo paint the image through the vmobjects directly
+            displayer.display_with_pattern(
+                self.get_cairo_context(pixel_array), *cvmobjects
+            )
+            return self
         cvmobject_pixel_array = displayer.display(*cvmobjects)
-        self.overlay_rgba_array(pixel_array, cvmobject_pixel_array)
+        # The background image has been multiplied by what cairo rendered, so
+        # its colors are premultiplied as well.
+        self.overlay_rgba_array(pixel_array, cvmobject_pixel_array, premultiplied=True)
         return self
 
+    def is_colored_only_by_background(self, vmobject):
+        """Returns whether all the colors vmobject is drawn with are white,
+        in which case its background image shows through unaltered.
+
+        Parameters
+        ----------
+        vmobject : VMobject
+            The VMobject
+
+        Returns
+        -------
+        bool
+        """
+        rgbas = [self.get_fill_rgbas(vmobject), self.get_stroke_rgbas(vmobject)]
+        if vmobject.get_stroke_width(background=True) != 0:
+            rgbas.append(self.get_stroke_rgbas(vmobject, background=True))
+        return all(np.all(rgba_array[:, :3] == 1) for rgba_array in rgbas)
+
     # Methods for other rendering
 
     # NOTE: Out of the following methods, only `transform_points_pre_display` and `points_to_pixel_coords` have been mentioned outside of their definitions.
@@ -873,30 +1068,82 @@ class Camera(object):
         """
         if len(points) == 0:
             return
+        if self.draft_render:
+            thickness = 1
         pixel_coords = self.points_to_pixel_coords(pmobject, points)
-        pixel_coords = self.thickened_coordinates(pixel_coords, thickness)
-        rgba_len = pixel_array.shape[2]
-
-        rgbas = (self.rgb_max_val * rgbas).astype(self.pixel_array_dtype)
-        target_len = len(pixel_coords)
-        factor = target_len // len(rgbas)
-        rgbas = np.array([rgbas] * factor).reshape((target_len, rgba_len))
+        nudges = self.get_thickening_nudges(thickness)
+        ph, pw, rgba_len = pixel_array.shape
 
-        on_screen_indices = self.on_screen_pixels(pixel_coords)
+        # Drop the points none of whose thickened pixels are on screen
+        min_nudge = nudges.min(0)
+        max_nudge = nudges.max(0)
+        on_screen_indices = reduce(
+            op.and_,
+            [
+                pixel_coords[:, 0] + max_nudge[0] >= 0,
+                pixel_coords[:, 0] + min_nudge[0] < pw,
+                pixel_coords[:, 1] + max_nudge[1] >= 0,
+                pixel_coords[:, 1] + min_nudge[1] < ph,
+            ],
+        )
         pixel_coords = pixel_coords[on_screen_indices]
         rgbas = rgbas[on_screen_indices]
+        if len(pixel_coords) == 0:
+            return
 
-        ph = self.get_pixel_height()
-        pw = self.get_pixel_width()
+        flat_pixel_array = pixel_array.reshape((ph * pw, rgba_len))
+        chunk_size = max(self.point_cloud_chunk_size // len(nudges), 1)
+        for start in range(0, len(pixel_coords), chunk_size):
+            self.splat_points(
+                flat_pixel_array,
+                pw,
+                ph,
+                pixel_coords[start : start + chunk_size],
+                rgbas[start : start + chunk_size],
+                nudges,
+            )
+        if not np.shares_memory(flat_pixel_array, pixel_array):
+            pixel_array[:, :] = flat_pixel_array.reshape((ph, pw, rgba_len))
 
-        flattener = np.array([1, pw], dtype="int")
-        flattener = flattener.reshape((2, 1))
-        indices = np.dot(pixel_coords, flattener)[:, 0]
-        indices = indices.astype("int")
+    def splat_points(self, flat_pixel_array, pw, ph, pixel_coords, rgbas, nudges):
+        """Alpha blends the thickened pixels of some points onto a flattened
+        pixel array.  Where points overlap, the last one is drawn on top.
 
-        new_pa = pixel_array.reshape((ph * pw, rgba_len))
-        new_pa[indices] = rgbas
-        pixel_array[:, :] = new_pa.reshape((ph, pw, rgba_len))
+        Parameters
+        ----------
+        flat_pixel_array : np.array
+            The pixel array, reshaped to (ph * pw, n_channels).
+        pw : int
+            The width of the pixel array.
+        ph : int
+            The height of the pixel array.
+        pixel_coords : np.array
+            The integer pixel coordinates of the points.
+        rgbas : np.array
+            The colors of the points, with values between 0 and 1.
+        nudges : np.array
+            The offsets of the pixels drawn around each point.
+        """
+        alphas = rgbas[:, 3:]
+        colors = np.hstack([rgbas[:, :3] * alphas, alphas]) * self.rgb_max_val
+        opaque = (alphas == 1).all()
+        if opaque:
+            colors = colors.astype(self.pixel_array_dtype)
+        else:
+            transparencies = 1 - alphas
+        indices = pixel_coords[:, 1] * pw + pixel_coords[:, 0]
+        for nudge_x, nudge_y in nudges:
+            xs = pixel_coords[:, 0] + nudge_x
+            ys = pixel_coords[:, 1] + nudge_y
+            on_screen = (xs >= 0) & (xs < pw) & (ys >= 0) & (ys < ph)
+            nudged_indices = indices[on_screen] + (nudge_y * pw + nudge_x)
+            if opaque:
+                flat_pixel_array[nudged_indices] = colors[on_screen]
+            else:
+                flat_pixel_array[nudged_indices] = np.round(
+                    colors[on_screen]
+                    + flat_pixel_array[nudged_indices] * transparencies[on_screen]
+                )
 
     def display_multiple_image_mobjects(self, image_mobjects, pixel_array):
         """Displays multiple image mobjects by modifiying the passed pixel_array.
@@ -914,6 +1161,10 @@ class Camera(object):
     def display_image_mobject(self, image_mobject, pixel_array):
         """Displays an ImageMobject by changing the pixel_array suitably.
 
+        The image is mapped onto the parallelogram spanned by its corners, so
+        rotations, stretches and shears are all accounted for, and only the
+        pixels inside that parallelogram's bounding box are touched.
+
         Parameters
         ----------
         image_mobject : ImageMobject
@@ -921,60 +1172,136 @@ class Camera(object):
         pixel_array : np.ndarray
             The Pixel array to put the imagemobject in.
         """
-        corner_coords = self.points_to_pixel_coords(image_mobject, image_mobject.points)
+        corner_coords = self.points_to_subpixel_coords(
+            image_mobject, image_mobject.points
+        )
         ul_coords, ur_coords, dl_coords = corner_coords
         right_vect = ur_coords - ul_coords
         down_vect = dl_coords - ul_coords
-        center_coords = ul_coords + (right_vect + down_vect) / 2
-
-        sub_image = Image.fromarray(image_mobject.get_pixel_array(), mode="RGBA")
 
-        # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords])), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords])), 1)
-        sub_image = sub_image.resize(
-            (pixel_width, pixel_height), resample=Image.BICUBIC
-        )
+        # Bounding box of the image within the pixel array
+        all_corners = np.array([ul_coords, ur_coords, dl_coords, ur_coords + down_vect])
+        pixel_height, pixel_width = pixel_array.shape[:2]
+        x0, y0 = np.clip(np.floor(all_corners.min(0)), 0, [pixel_width, pixel_height])
+        x1, y1 = np.clip(np.ceil(all_corners.max(0)), 0, [pixel_width, pixel_height])
+        x0, y0, x1, y1 = int(x0), int(y0), int(x1), int(y1)
+        if x0 >= x1 or y0 >= y1:
+            return
 
-        # Rotate
-        angle = angle_of_vector(right_vect)
-        adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle, resample=Image.BICUBIC, expand=1
+        sub_image = image_mobject.get_pixel_array()
+        # Shrinking an image by sampling it would alias, so filter it down to
+        # (roughly) its displayed size first.
+        target_width = max(int(get_norm(right_vect)), 1)
+        target_height = max(int(get_norm(down_vect)), 1)
+        image_height, image_width = sub_image.shape[:2]
+        if target_width < image_width or target_height < image_height:
+            sub_image = np.array(
+                Image.fromarray(sub_image, mode="RGBA").resize(
+                    (
+                        min(target_width, image_width),
+                        min(target_height, image_height),
+                    ),
+                    resample=Image.BICUBIC,
+                )
             )
+            image_height, image_width = sub_image.shape[:2]
+
+        # Affine map from image coordinates to pixel coordinates
+        transform = np.array([right_vect / image_width, down_vect / image_height]).T
+        if abs(np.linalg.det(transform)) < 1e-8:
+            return
+        inverse = np.linalg.inv(transform)
 
-        # TODO, there is no accounting for a shear...
+        # Image coordinates of the center of every pixel in the bounding box
+        xs = np.arange(x0, x1) + 0.5 - ul_coords[0]
+        ys = np.arange(y0, y1) + 0.5 - ul_coords[1]
+        image_xs = inverse[0, 0] * xs[np.newaxis, :] + inverse[0, 1] * ys[:, np.newaxis]
+        image_ys = inverse[1, 0] * xs[np.newaxis, :] + inverse[1, 1] * ys[:, np.newaxis]
 
-        # Paste into an image as large as the camear's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.get_pixel_height(), self.get_pixel_width())), mode="RGBA"
-        )
-        new_ul_coords = center_coords - np.array(sub_image.size) / 2
-        new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            ),
+        warped = self.sample_rgba_array(sub_image, image_xs, image_ys)
+        self.overlay_rgba_array(pixel_array[y0:y1, x0:x1], warped, premultiplied=True)
+
+    def sample_rgba_array(self, rgba_array, xs, ys):
+        """Bilinearly samples an RGBA array at the given (fractional) coordinates.
+
+        Coordinates are measured in pixels from the upper left corner of the
+        array, and points outside of it are transparent, which gives the
+        sampled image antialiased edges.
+
+        Parameters
+        ----------
+        rgba_array : np.ndarray
+            The (h, w, 4) array to sample from.
+        xs : np.ndarray
+            The horizontal coordinates to sample at.
+        ys : np.ndarray
+            The vertical coordinates to sample at, of the same shape as xs.
+
+        Returns
+        -------
+        np.ndarray
+            A premultiplied RGBA array of shape xs.shape + (4,)
+        """
+        height, width = rgba_array.shape[:2]
+        # Interpolate premultiplied colors, so transparent pixels don't bleed,
+        # within a one pixel transparent border.
+        padded = np.zeros((height + 2, width + 2, 4), dtype=np.float32)
+        alphas = rgba_array[:, :, 3:].astype(np.float32) / 255
+        padded[1:-1, 1:-1, :3] = rgba_array[:, :, :3] * alphas
+        padded[1:-1, 1:-1, 3:] = alphas * 255
+
+        xs = np.clip(xs + 0.5, 0, width + 1)
+        ys = np.clip(ys + 0.5, 0, height + 1)
+        col0 = np.minimum(xs.astype(int), width)
+        row0 = np.minimum(ys.astype(int), height)
+        x_weights = (xs - col0)[..., np.newaxis].astype(np.float32)
+        y_weights = (ys - row0)[..., np.newaxis].astype(np.float32)
+        top = interpolate(padded[row0, col0], padded[row0, col0 + 1], x_weights)
+        bottom = interpolate(
+            padded[row0 + 1, col0], padded[row0 + 1, col0 + 1], x_weights
         )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        result = interpolate(top, bottom, y_weights)
+
+        return np.round(result).astype(self.pixel_array_dtype)
 
-    def overlay_rgba_array(self, pixel_array, new_array):
-        """Overlays an RGBA array on top of the given Pixel array.
+    def overlay_rgba_array(self, pixel_array, new_array, premultiplied=False):
+        """Overlays an RGBA array on top of the given Pixel array, in place.
+
+        The pixel array is treated as premultiplied, which is how cairo
+        renders into it, and only the bounding box of the non-transparent
+        pixels of new_array is blended.
 
         Parameters
         ----------
         pixel_array : np.array
             The original pixel array to modify.
         new_array : np.array
-            The new pixel array to overlay.
+            The new pixel array to overlay, of the same shape.
+        premultiplied : bool, optional
+            Whether the colors of new_array are already multiplied by
+            their alpha.
         """
-        self.overlay_PIL_image(pixel_array, self.get_image(new_array))
+        opaque_rows = np.flatnonzero(new_array[:, :, 3].any(1))
+        if len(opaque_rows) == 0:
+            return
+        y0, y1 = opaque_rows[0], opaque_rows[-1] + 1
+        opaque_cols = np.flatnonzero(new_array[y0:y1, :, 3].any(0))
+        x0, x1 = opaque_cols[0], opaque_cols[-1] + 1
+
+        source = new_array[y0:y1, x0:x1].astype(np.uint16)
+        if not premultiplied:
+            source[:, :, :3] *= source[:, :, 3:]
+            source[:, :, :3] += 127
+            source[:, :, :3] //= 255
+        target = pixel_array[y0:y1, x0:x1]
+        # out = source + target * (1 - source_alpha)
+        blended = target.astype(np.uint16)
+        blended *= 255 - source[:, :, 3:]
+        blended += 127
+        blended //= 255
+        blended += source
+        np.minimum(blended, 255, out=blended)
+        target[:] = blended
 
     def overlay_PIL_image(self, pixel_array, image):
         """Overlays a PIL image on the passed pixel array.
@@ -986,9 +1313,7 @@ class Camera(object):
         image : PIL.Image
             The Image to overlay.
         """
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(self.get_image(pixel_array), image), dtype="uint8"
-        )
+        self.overlay_rgba_array(pixel_array, np.asarray(image.convert("RGBA")))
 
     def adjust_out_of_range_points(self, points):
         """If any of the points in the passed array are out of
@@ -1030,7 +1355,24 @@ class Camera(object):
             points = np.zeros((1, 3))
         return points
 
-    def points_to_pixel_coords(
+    def get_points_transform_key(self, mobject):
+        """Gets what transform_points_pre_display depends on, besides the
+        points of the passed mobject.
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject whose points are transformed.
+
+        Returns
+        -------
+        tuple
+            A key which changes whenever the same points could be
+            transformed differently, or None if it can't tell.
+        """
+        return ()
+
+    def points_to_subpixel_coords(
         self, mobject, points
     ):  # TODO: Write more detailed docstrings for this method.
         points = self.transform_points_pre_display(mobject, points)
@@ -1050,7 +1392,10 @@ class Camera(object):
 
         result[:, 0] = shifted_points[:, 0] * width_mult + width_add
         result[:, 1] = shifted_points[:, 1] * height_mult + height_add
-        return result.astype("int")
+        return result
+
+    def points_to_pixel_coords(self, mobject, points):
+        return self.points_to_subpixel_coords(mobject, points).astype("int")
 
     def on_screen_pixels(self, pixel_coords):
         """Returns array of pixels that are on the screen from a given
@@ -1180,6 +1525,7 @@ class BackgroundColoredVMobjectDisplayer(object):
         """
         self.camera = camera
         self.file_name_to_pixel_array_map = {}
+        self.file_name_to_pattern_map = {}
         self.pixel_array = np.array(camera.get_pixel_array())
         self.reset_pixel_array()
 
@@ -1257,6 +1603,76 @@ class BackgroundColoredVMobjectDisplayer(object):
         self.file_name_to_pixel_array_map[file_name] = back_array
         return back_array
 
+    def get_background_pattern(self, file_name):
+        """Gets a cairo pattern of the background image with the passed file_name,
+        premultiplied and laid out the same way as the camera's pixel array.
+
+        Parameters
+        ----------
+        file_name : str
+            The file_name of the background image.
+
+        Returns
+        -------
+        cairo.SurfacePattern
+            The pattern, mapping the image's pixels to the camera's.
+        np.array
+            The premultiplied pixels of the image, which the pattern reads.
+        """
+        if file_name in self.file_name_to_pattern_map:
+            return self.file_name_to_pattern_map[file_name]
+        full_path = get_full_raster_image_path(file_name)
+        image_array = np.array(Image.open(full_path).convert("RGBA"))
+        alphas = image_array[:, :, 3:].astype(np.uint16)
+        image_array[:, :, :3] = (image_array[:, :, :3] * alphas + 127) // 255
+        height, width = image_array.shape[:2]
+        surface = cairo.ImageSurface.create_for_data(
+            image_array, cairo.FORMAT_ARGB32, width, height
+        )
+        pattern = cairo.SurfacePattern(surface)
+        # Keep the array alive for as long as cairo reads from it
+        self.file_name_to_pattern_map[file_name] = (pattern, image_array)
+        return pattern, image_array
+
+    def display_with_pattern(self, ctx, *cvmobjects):
+        """Displays vmobjects drawn in white by painting their background
+        images through them, in the passed cairo context.
+
+        Parameters
+        ----------
+        ctx : cairo.Context
+            The camera's cairo context.
+        *cvmobjects : VMobject
+            The VMobjects
+        """
+        batch_image_file_pairs = batch_by_property(
+            cvmobjects, lambda cv: cv.get_background_image_file()
+        )
+        pixel_height, pixel_width = self.pixel_array.shape[:2]
+        for batch, image_file in batch_image_file_pairs:
+            pattern, image_array = self.get_background_pattern(image_file)
+            image_height, image_width = image_array.shape[:2]
+            # The image is stretched over the whole pixel array
+            matrix = ctx.get_matrix()
+            matrix = matrix.multiply(
+                cairo.Matrix(
+                    image_width / pixel_width, 0, 0, image_height / pixel_height
+                )
+            )
+            pattern.set_matrix(matrix)
+
+            ctx.push_group()
+            for vmobject in batch:
+                self.camera.display_vectorized(vmobject, ctx)
+            # Keep the image only where the vmobjects were drawn, with
+            # their opacity
+            ctx.set_operator(cairo.OPERATOR_IN)
+            ctx.set_source(pattern)
+            ctx.paint()
+            ctx.set_operator(cairo.OPERATOR_OVER)
+            ctx.pop_group_to_source()
+            ctx.paint()
+
     def display(self, *cvmobjects):
         """Displays the colored VMobjects.
 
@@ -1,3 +1,5 @@
+import weakref
+
 import numpy as np
 
 from ..camera.camera import Camera
@@ -12,33 +14,73 @@ from ..utils.config_ops import digest_config
 class MappingCamera(Camera):
     """Camera object that allows mapping
     between objects.
+
+    By default ``mapping_func`` is called once per point.  Functions which
+    work on arrays of points, e.g. those made of numpy operations along the
+    last axis, can set ``vectorized_mapping_func`` to be called once per
+    mobject with an (N, 3) array of points instead.  It is off by default,
+    since many mapping functions only take a single point, e.g. those going
+    through :func:`~.R3_to_complex`.
     """
 
     CONFIG = {
         "mapping_func": lambda p: p,
+        "vectorized_mapping_func": False,
         "min_num_curves": 50,
         "allow_object_intrusion": False,
     }
 
-    def points_to_pixel_coords(self, points):
-        return Camera.points_to_pixel_coords(
-            self, np.apply_along_axis(self.mapping_func, 1, points)
+    def __init__(self, **kwargs):
+        # Subdivided points of the vmobjects with too few curves, along with
+        # the version of the points they were computed from
+        self.subdivided_points = weakref.WeakKeyDictionary()
+        Camera.__init__(self, **kwargs)
+
+    def map_points(self, points):
+        if self.vectorized_mapping_func:
+            return np.array(self.mapping_func(points), dtype=float).reshape(
+                points.shape
+            )
+        return np.apply_along_axis(self.mapping_func, 1, points)
+
+    def transform_points_pre_display(self, mobject, points):
+        if points is mobject.points and self.needs_subdivision(mobject):
+            points = self.get_subdivided_points(mobject)
+        points = Camera.transform_points_pre_display(self, mobject, points)
+        return self.map_points(points)
+
+    def needs_subdivision(self, mobject):
+        return (
+            isinstance(mobject, VMobject)
+            and 0 < mobject.get_num_curves() < self.min_num_curves
+        )
+
+    def get_subdivided_points(self, vmobject):
+        """Returns the points vmobject would have after inserting
+        min_num_curves curves, reusing those of previous frames if its
+        points have not changed since.
+        """
+        cached = self.subdivided_points.get(vmobject)
+        if cached is not None and cached[0] == vmobject.points_version:
+            return cached[1]
+        new_points = vmobject.insert_n_curves_to_point_list(
+            self.min_num_curves, vmobject.get_points()
         )
+        if vmobject.has_new_path_started():
+            new_points = np.append(new_points, [vmobject.get_last_point()], axis=0)
+        self.subdivided_points[vmobject] = (vmobject.points_version, new_points)
+        return new_points
 
     def capture_mobjects(self, mobjects, **kwargs):
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
         if self.allow_object_intrusion:
-            mobject_copies = mobjects
-        else:
-            mobject_copies = [mobject.copy() for mobject in mobjects]
-        for mobject in mobject_copies:
-            if (
-                isinstance(mobject, VMobject)
-                and 0 < mobject.get_num_curves() < self.min_num_curves
-            ):
-                mobject.insert_n_curves(self.min_num_curves)
+            for mobject in mobjects:
+                if self.needs_subdivision(mobject):
+                    mobject.insert_n_curves(self.min_num_curves)
+        # Otherwise the curves are only inserted into the points being
+        # displayed, see transform_points_pre_display
         Camera.capture_mobjects(
-            self, mobject_copies, include_submobjects=False, excluded_mobjects=None,
+            self, mobjects, include_submobjects=False, excluded_mobjects=None,
         )
 
 
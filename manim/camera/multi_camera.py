@@ -1,6 +1,21 @@
+import numpy as np
+
 from ..camera.moving_camera import MovingCamera
 from ..utils.iterables import list_difference_update
 
+# Attributes which, along with its points, determine how a mobject looks
+RENDERED_ATTRIBUTES = [
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "sheen_direction",
+    "rgbas",
+    "pixel_array",
+]
+
 
 class MultiCamera(MovingCamera):
     """Camera Object that allows for multiple perspectives.
@@ -21,6 +36,9 @@ class MultiCamera(MovingCamera):
             Any valid keyword arguments of MovingCamera.
         """
         self.image_mobjects_from_cameras = []
+        # Keys describing what each sub camera last rendered from scratch
+        self.sub_camera_render_keys = dict()
+        self.sub_cameras_need_reset = True
         for imfc in image_mobjects_from_cameras:
             self.add_image_mobject_from_camera(imfc)
         MovingCamera.__init__(self, **kwargs)
@@ -48,10 +66,42 @@ class MultiCamera(MovingCamera):
                 imfc.camera.frame.get_height(),
                 imfc.camera.frame.get_width(),
             )
-            imfc.camera.reset_pixel_shape(
+            new_pixel_shape = (
                 int(pixel_height * imfc.get_height() / self.get_frame_height()),
                 int(pixel_width * imfc.get_width() / self.get_frame_width()),
             )
+            # Reallocating the pixel arrays would also throw away the
+            # previous render, so only do it when the size changes
+            if new_pixel_shape != imfc.camera.get_pixel_array().shape[:2]:
+                imfc.camera.reset_pixel_shape(*new_pixel_shape)
+                self.sub_camera_render_keys.pop(imfc, None)
+
+    def get_render_key(self, camera, mobjects):
+        """Returns a hash of everything that determines what camera would
+        render for the passed mobjects: its frame, its pixel shape, and the
+        points and style of each mobject.
+
+        Parameters
+        ----------
+        camera : MovingCamera
+            The sub camera.
+        mobjects : list
+            The mobjects it would display.
+
+        Returns
+        -------
+        int
+        """
+        key = [camera.frame.points.tobytes(), camera.get_pixel_array().shape]
+        for mobject in mobjects:
+            key.append(id(mobject))
+            key.append(mobject.points.tobytes())
+            for attr in RENDERED_ATTRIBUTES:
+                value = getattr(mobject, attr, None)
+                if isinstance(value, np.ndarray):
+                    value = value.tobytes()
+                key.append(value)
+        return hash(tuple(key))
 
     def reset(self):
         """Resets the MultiCamera.
@@ -61,19 +111,41 @@ class MultiCamera(MovingCamera):
         MultiCamera
             The reset MultiCamera
         """
-        for imfc in self.image_mobjects_from_cameras:
-            imfc.camera.reset()
         MovingCamera.reset(self)
+        # The sub cameras are only reset once it is known that what they
+        # show has changed, see capture_mobjects
+        self.sub_cameras_need_reset = True
         return self
 
+    def set_pixel_array(self, pixel_array, convert_from_floats=False):
+        # Drawing on top of a background, so the sub cameras draw on top of
+        # what they already show as well
+        self.sub_cameras_need_reset = False
+        MovingCamera.set_pixel_array(self, pixel_array, convert_from_floats)
+
     def capture_mobjects(self, mobjects, **kwargs):
         self.update_sub_cameras()
+        # One display list, shared by all cameras
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
         for imfc in self.image_mobjects_from_cameras:
             to_add = list(mobjects)
             if not self.allow_cameras_to_capture_their_own_display:
                 to_add = list_difference_update(to_add, imfc.get_family())
-            imfc.camera.capture_mobjects(to_add, **kwargs)
-        MovingCamera.capture_mobjects(self, mobjects, **kwargs)
+            if self.sub_cameras_need_reset:
+                render_key = self.get_render_key(imfc.camera, to_add)
+                if self.sub_camera_render_keys.get(imfc) == render_key:
+                    # Nothing it shows has changed since its last render
+                    continue
+                imfc.camera.reset()
+                self.sub_camera_render_keys[imfc] = render_key
+            else:
+                self.sub_camera_render_keys.pop(imfc, None)
+            imfc.camera.capture_mobjects(
+                to_add, include_submobjects=False, excluded_mobjects=None
+            )
+        MovingCamera.capture_mobjects(
+            self, mobjects, include_submobjects=False, excluded_mobjects=None
+        )
 
     def get_mobjects_indicating_movement(self):
         """Returns all mobjets whose movement implies that the camera
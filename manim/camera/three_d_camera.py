@@ -3,13 +3,11 @@ import numpy as np
 from ..camera.camera import Camera
 from ..constants import *
 from ..config import config
-from ..mobject.three_d_utils import get_3d_vmob_end_corner
-from ..mobject.three_d_utils import get_3d_vmob_end_corner_unit_normal
-from ..mobject.three_d_utils import get_3d_vmob_start_corner
-from ..mobject.three_d_utils import get_3d_vmob_start_corner_unit_normal
+from ..mobject.three_d_utils import get_3d_vmobs_corners_and_unit_normals
 from ..mobject.types.point_cloud_mobject import Point
+from ..mobject.types.vectorized_mobject import VMobject
 from ..mobject.value_tracker import ValueTracker
-from ..utils.color import get_shaded_rgb
+from ..utils.color import get_shading_factors
 from ..utils.simple_functions import clip_in_place
 from ..utils.space_ops import rotation_about_z
 from ..utils.space_ops import rotation_matrix
@@ -49,11 +47,24 @@ class ThreeDCamera(Camera):
         self.frame_center = Point(self.frame_center)
         self.fixed_orientation_mobjects = dict()
         self.fixed_in_frame_mobjects = set()
+        # Filled in once per frame by get_mobjects_to_display, then shared
+        # by the fill, stroke and background stroke of every face
+        self.shading_factors = dict()
+        # Camera parameters and projected points of the frame being captured
+        self.projection_parameters = None
+        self.projected_points = dict()
         self.reset_rotation_matrix()
 
     def capture_mobjects(self, mobjects, **kwargs):
         self.reset_rotation_matrix()
+        self.projection_parameters = (
+            np.array(self.get_frame_center()),
+            self.get_distance(),
+            self.get_rotation_matrix(),
+        )
         Camera.capture_mobjects(self, mobjects, **kwargs)
+        self.projection_parameters = None
+        self.projected_points = dict()
 
     def get_value_trackers(self):
         """Returns list of ValueTrackers of phi, theta, distance and gamma
@@ -76,26 +87,34 @@ class ThreeDCamera(Camera):
         if not self.should_apply_shading:
             return rgbas
         if vmobject.shade_in_3d and (vmobject.get_num_points() > 0):
-            light_source_point = self.light_source.points[0]
             if len(rgbas) < 2:
                 shaded_rgbas = rgbas.repeat(2, axis=0)
             else:
                 shaded_rgbas = np.array(rgbas[:2])
-            shaded_rgbas[0, :3] = get_shaded_rgb(
-                shaded_rgbas[0, :3],
-                get_3d_vmob_start_corner(vmobject),
-                get_3d_vmob_start_corner_unit_normal(vmobject),
-                light_source_point,
-            )
-            shaded_rgbas[1, :3] = get_shaded_rgb(
-                shaded_rgbas[1, :3],
-                get_3d_vmob_end_corner(vmobject),
-                get_3d_vmob_end_corner_unit_normal(vmobject),
-                light_source_point,
-            )
+            factors = self.shading_factors.get(vmobject)
+            if factors is None:
+                factors = self.get_shading_factors([vmobject])[0]
+            shaded_rgbas[:, :3] += factors[:, np.newaxis]
             return shaded_rgbas
         return rgbas
 
+    def get_shading_factors(self, vmobjects):
+        """Computes, for each vmobject, how much shading brightens (or
+        darkens) the colors at its start and end corners.
+
+        Parameters
+        ----------
+        vmobjects : list
+            The VMobjects to shade, all of which must have points.
+
+        Returns
+        -------
+        np.array
+            An array of shape (len(vmobjects), 2)
+        """
+        corners, unit_normals = get_3d_vmobs_corners_and_unit_normals(vmobjects)
+        return get_shading_factors(corners, unit_normals, self.light_source.points[0])
+
     def get_stroke_rgbas(
         self, vmobject, background=False
     ):  # NOTE : DocStrings From parent
@@ -106,16 +125,96 @@ class ThreeDCamera(Camera):
 
     def get_mobjects_to_display(self, *args, **kwargs):  # NOTE : DocStrings From parent
         mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
-        rot_matrix = self.get_rotation_matrix()
+        shaded_mobjects = [
+            mob for mob in mobjects if hasattr(mob, "shade_in_3d") and mob.shade_in_3d
+        ]
+
+        # Shade all faces at once
+        self.shading_factors = dict()
+        if self.should_apply_shading:
+            shaded_vmobjects = [
+                mob
+                for mob in shaded_mobjects
+                if isinstance(mob, VMobject) and mob.get_num_points() > 0
+            ]
+            self.shading_factors = dict(
+                zip(shaded_vmobjects, self.get_shading_factors(shaded_vmobjects))
+            )
+
+        # Sort three dimensional mobjects based on how close they are to
+        # the camera, after all others
+        z_keys = np.full(len(mobjects), np.inf)
+        if shaded_mobjects:
+            shaded_indices = [
+                i
+                for i, mob in enumerate(mobjects)
+                if hasattr(mob, "shade_in_3d") and mob.shade_in_3d
+            ]
+            reference_points = self.get_z_index_reference_points(shaded_mobjects)
+            z_keys[shaded_indices] = np.dot(
+                reference_points, self.get_rotation_matrix()[2]
+            )
+        mobjects = [mobjects[i] for i in np.argsort(z_keys, kind="stable")]
+        self.project_mobjects(mobjects)
+        return mobjects
+
+    def get_z_index_reference_points(self, mobjects):
+        """Batched version of Mobject.get_z_index_reference_point.
 
-        def z_key(mob):
-            if not (hasattr(mob, "shade_in_3d") and mob.shade_in_3d):
-                return np.inf
-            # Assign a number to a three dimensional mobjects
-            # based on how close it is to the camera
-            return np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects.
+
+        Returns
+        -------
+        np.array
+            An array of shape (len(mobjects), 3)
+        """
+        result = np.zeros((len(mobjects), 3))
+
+        # The reference point of a VMobject with no submobjects is the
+        # center of the bounding box of its anchors, which can be computed
+        # for all of them together.
+        def is_simple(mob):
+            n_points = len(mob.points)
+            return (
+                isinstance(mob, VMobject)
+                and not mob.submobjects
+                and getattr(mob, "z_index_group", mob) is mob
+                and (n_points == 1 or n_points >= mob.n_points_per_cubic_curve)
+            )
 
-        return sorted(mobjects, key=z_key)
+        simple_indices = []
+        for i, mob in enumerate(mobjects):
+            if is_simple(mob):
+                simple_indices.append(i)
+            else:
+                result[i] = mob.get_z_index_reference_point()
+        if not simple_indices:
+            return result
+
+        simple_mobjects = [mobjects[i] for i in simple_indices]
+        lengths = np.array([len(mob.points) for mob in simple_mobjects])
+        nppcs = np.repeat(
+            [mob.n_points_per_cubic_curve for mob in simple_mobjects], lengths
+        )
+        all_points = np.vstack([mob.points for mob in simple_mobjects])
+        offsets = np.cumsum(lengths) - lengths
+        point_indices = np.arange(len(all_points)) - np.repeat(offsets, lengths)
+        repeated_lengths = np.repeat(lengths, lengths)
+        is_anchor = (repeated_lengths == 1) | (
+            (point_indices < nppcs * (repeated_lengths // nppcs))
+            & ((point_indices % nppcs == 0) | (point_indices % nppcs == nppcs - 1))
+        )
+        anchors = all_points[is_anchor]
+        n_anchors = np.add.reduceat(is_anchor, offsets)
+        anchor_offsets = np.cumsum(n_anchors) - n_anchors
+        result[simple_indices] = 0.5 * (
+            np.minimum.reduceat(anchors, anchor_offsets)
+            + np.maximum.reduceat(anchors, anchor_offsets)
+        )
+        return result
 
     def get_phi(self):
         """Returns the Polar angle (the angle off Z_AXIS) phi.
@@ -269,30 +368,87 @@ class ThreeDCamera(Camera):
         np.array
             The points after projecting.
         """
-        frame_center = self.get_frame_center()
-        distance = self.get_distance()
-        rot_matrix = self.get_rotation_matrix()
+        if self.projection_parameters is not None:
+            frame_center, distance, rot_matrix = self.projection_parameters
+        else:
+            frame_center = self.get_frame_center()
+            distance = self.get_distance()
+            rot_matrix = self.get_rotation_matrix()
 
         points = points - frame_center
         points = np.dot(points, rot_matrix.T)
         zs = points[:, 2]
-        for i in 0, 1:
-            if self.exponential_projection:
-                # Proper projedtion would involve multiplying
-                # x and y by d / (d-z).  But for points with high
-                # z value that causes weird artifacts, and applying
-                # the exponential helps smooth it out.
-                factor = np.exp(zs / distance)
-                lt0 = zs < 0
-                factor[lt0] = distance / (distance - zs[lt0])
-            else:
-                factor = distance / (distance - zs)
-                factor[(distance - zs) < 0] = 10 ** 6
-                # clip_in_place(factor, 0, 10**6)
-            points[:, i] *= factor
+        if self.exponential_projection:
+            # Proper projedtion would involve multiplying
+            # x and y by d / (d-z).  But for points with high
+            # z value that causes weird artifacts, and applying
+            # the exponential helps smooth it out.
+            factor = np.exp(zs / distance)
+            lt0 = zs < 0
+            factor[lt0] = distance / (distance - zs[lt0])
+        else:
+            factor = distance / (distance - zs)
+            factor[(distance - zs) < 0] = 10 ** 6
+            # clip_in_place(factor, 0, 10**6)
+        points[:, :2] *= factor[:, np.newaxis]
         points = points + frame_center
         return points
 
+    def project_mobjects(self, mobjects):
+        """Projects the points of all the passed mobjects at once, for
+        transform_points_pre_display to hand out while the frame is captured.
+
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects about to be displayed.
+        """
+        self.projected_points = dict()
+        if self.projection_parameters is None:
+            # Not capturing a frame, so the camera might move before the
+            # points are used
+            return
+        free_mobjects = []
+        fixed_orientation_mobjects = []
+        for mobject in mobjects:
+            if mobject in self.fixed_in_frame_mobjects:
+                continue
+            if not np.all(np.isfinite(mobject.points)):
+                continue
+            if mobject in self.fixed_orientation_mobjects:
+                fixed_orientation_mobjects.append(mobject)
+            else:
+                free_mobjects.append(mobject)
+
+        if free_mobjects:
+            projected = self.project_points(
+                np.vstack([mobject.points for mobject in free_mobjects])
+            )
+            split_indices = np.cumsum(
+                [len(mobject.points) for mobject in free_mobjects]
+            )
+            for mobject, points in zip(
+                free_mobjects, np.split(projected, split_indices[:-1])
+            ):
+                self.projected_points[mobject] = points
+
+        if fixed_orientation_mobjects:
+            # Members of a family usually share their center function, so
+            # only evaluate each of them once
+            centers = dict()
+            for mobject in fixed_orientation_mobjects:
+                center_func = self.fixed_orientation_mobjects[mobject]
+                if center_func not in centers:
+                    centers[center_func] = center_func()
+            center_funcs = list(centers.keys())
+            old_centers = np.array([centers[func] for func in center_funcs])
+            shifts = dict(
+                zip(center_funcs, self.project_points(old_centers) - old_centers)
+            )
+            for mobject in fixed_orientation_mobjects:
+                center_func = self.fixed_orientation_mobjects[mobject]
+                self.projected_points[mobject] = mobject.points + shifts[center_func]
+
     def project_point(self, point):
         """Applies the current rotation_matrix as a projection
         matrix to the passed point.
@@ -312,6 +468,9 @@ class ThreeDCamera(Camera):
     def transform_points_pre_display(
         self, mobject, points
     ):  # TODO: Write Docstrings for this Method.
+        projected_points = self.projected_points.get(mobject)
+        if projected_points is not None and points is mobject.points:
+            return projected_points
         points = super().transform_points_pre_display(mobject, points)
         fixed_orientation = mobject in self.fixed_orientation_mobjects
         fixed_in_frame = mobject in self.fixed_in_frame_mobjects
@@ -326,6 +485,22 @@ class ThreeDCamera(Camera):
         else:
             return self.project_points(points)
 
+    def get_points_transform_key(self, mobject):
+        if mobject in self.fixed_in_frame_mobjects:
+            return ()
+        if mobject in self.fixed_orientation_mobjects:
+            # The center function may depend on anything
+            return None
+        if self.projection_parameters is None:
+            return None
+        frame_center, distance, rot_matrix = self.projection_parameters
+        return (
+            frame_center.tobytes(),
+            distance,
+            rot_matrix.tobytes(),
+            self.exponential_projection,
+        )
+
     def add_fixed_orientation_mobjects(
         self, *mobjects, use_static_center_func=False, center_func=None
     ):
@@ -390,7 +565,7 @@ class ThreeDCamera(Camera):
         """
         for mobject in self.extract_mobject_family_members(mobjects):
             if mobject in self.fixed_orientation_mobjects:
-                self.fixed_orientation_mobjects.remove(mobject)
+                self.fixed_orientation_mobjects.pop(mobject)
 
     def remove_fixed_in_frame_mobjects(self, *mobjects):
         """If a mobject was fixed in frame by passing it through
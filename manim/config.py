@@ -32,7 +32,18 @@ def _parse_config(config_parser, args):
             break
     else:
         section = config_parser["CLI"]
-    config = {opt: section.getint(opt) for opt in config_parser[flag]}
+    config = {
+        opt: section.getint(opt)
+        for opt in ["pixel_height", "pixel_width", "frame_rate"]
+    }
+
+    # Handle the --draft flag.  A quality section may also turn draft
+    # rendering on by itself, e.g. to make every -l render a draft.
+    config["draft_render"] = (
+        section.getboolean("draft_render", fallback=default.getboolean("draft_render"))
+        if args.draft is None
+        else args.draft
+    )
 
     config["default_pixel_height"] = default.getint("pixel_height")
     config["default_pixel_width"] = default.getint("pixel_width")
@@ -42,6 +42,9 @@ class Mobject(Container):
         "z_index": 0,
     }
 
+    # Incremented whenever the points change, see note_changed_points
+    points_version = 0
+
     def __init__(self, **kwargs):
         Container.__init__(self, **kwargs)
         self.submobjects = []
@@ -57,6 +60,26 @@ class Mobject(Container):
     def __str__(self):
         return str(self.name)
 
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self.note_changed_points()
+
+    def note_changed_points(self):
+        """Marks the points as changed, so that what was computed from them
+        (e.g. by the camera) is computed again.
+
+        Setting ``points``, including with augmented assignments such as
+        ``mob.points += vect``, calls this already.  Code writing into the
+        points array in place, e.g. ``mob.points[:] = 0``, must call it.
+        """
+        self.points_version += 1
+        return self
+
     def reset_points(self):
         self.points = np.zeros((0, self.dim))
 
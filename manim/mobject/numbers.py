@@ -2,6 +2,37 @@ from ..constants import *
 from ..mobject.svg.tex_mobject import SingleStringTexMobject
 from ..mobject.types.vectorized_mobject import VMobject
 
+# Glyphs of DecimalNumber (digits, signs, decimal point, ellipsis, unit),
+# keyed by tex string and style.  They are rendered once and copied, so
+# changing a number's value never goes through TeX or SVG parsing again.
+DECIMAL_GLYPH_CACHE = {}
+
+
+def get_decimal_glyph(tex_string, config):
+    key = (tex_string, repr(sorted(config.items())))
+    if key not in DECIMAL_GLYPH_CACHE:
+        DECIMAL_GLYPH_CACHE[key] = SingleStringTexMobject(tex_string, **config)
+    return DECIMAL_GLYPH_CACHE[key]
+
+
+def copy_glyph_points(glyph, target):
+    """Copy the points of ``glyph`` into ``target`` in place.
+
+    Returns False, leaving ``target`` untouched, if the two do not have the
+    same structure.
+    """
+    glyph_family = glyph.get_family()
+    target_family = target.get_family()
+    if len(glyph_family) != len(target_family):
+        return False
+    for glyph_mob, target_mob in zip(glyph_family, target_family):
+        if glyph_mob.points.shape == target_mob.points.shape:
+            target_mob.points[:] = glyph_mob.points
+            target_mob.note_changed_points()
+        else:
+            target_mob.points = np.array(glyph_mob.points)
+    return True
+
 
 class DecimalNumber(VMobject):
     CONFIG = {
@@ -20,6 +51,18 @@ class DecimalNumber(VMobject):
         self.number = number
         self.initial_config = kwargs
 
+        num_string = self.get_num_string(number)
+        self.add(
+            *[
+                get_decimal_glyph(tex_string, glyph_config).copy()
+                for tex_string, glyph_config in self.get_glyph_specs(num_string)
+            ]
+        )
+        self.arrange_glyphs(num_string)
+        if self.include_background_rectangle:
+            self.add_background_rectangle()
+
+    def get_num_string(self, number):
         if isinstance(number, complex):
             formatter = self.get_complex_formatter()
         else:
@@ -32,21 +75,19 @@ class DecimalNumber(VMobject):
                 num_string = "+" + num_string[1:]
             else:
                 num_string = num_string[1:]
+        return num_string
 
-        self.add(*[SingleStringTexMobject(char, **kwargs) for char in num_string])
-
+    def get_glyph_specs(self, num_string):
+        """Return the (tex string, config) pair of every glyph of the number."""
+        specs = [(char, self.initial_config) for char in num_string]
         # Add non-numerical bits
         if self.show_ellipsis:
-            self.add(SingleStringTexMobject("\\dots"))
-
-        if num_string.startswith("-"):
-            minus = self.submobjects[0]
-            minus.next_to(self.submobjects[1], LEFT, buff=self.digit_to_digit_buff)
-
+            specs.append(("\\dots", {}))
         if self.unit is not None:
-            self.unit_sign = SingleStringTexMobject(self.unit, color=self.color)
-            self.add(self.unit_sign)
+            specs.append((self.unit, {"color": self.color}))
+        return specs
 
+    def arrange_glyphs(self, num_string):
         self.arrange(buff=self.digit_to_digit_buff, aligned_edge=DOWN)
 
         # Handle alignment of parts that should be aligned
@@ -57,11 +98,10 @@ class DecimalNumber(VMobject):
                 self[i].shift(self[i + 1].get_height() * DOWN / 2)
             elif c == ",":
                 self[i].shift(self[i].get_height() * DOWN / 2)
-        if self.unit and self.unit.startswith("^"):
-            self.unit_sign.align_to(self, UP)
-        #
-        if self.include_background_rectangle:
-            self.add_background_rectangle()
+        if self.unit is not None:
+            self.unit_sign = self[-1]
+            if self.unit.startswith("^"):
+                self.unit_sign.align_to(self, UP)
 
     def get_formatter(self, **kwargs):
         """
@@ -104,6 +144,46 @@ class DecimalNumber(VMobject):
         )
 
     def set_value(self, number, **config):
+        if config:
+            return self.rebuild_with_value(number, **config)
+        background = None
+        if self.include_background_rectangle:
+            background = self.background_rectangle
+            self.remove(background)
+        glyphs = self.submobjects
+        # Make sure last digit has constant height
+        last_height = glyphs[-1].get_height()
+        anchor = self.get_critical_point(self.edge_to_fix)
+
+        num_string = self.get_num_string(number)
+        specs = self.get_glyph_specs(num_string)
+        new_glyphs = []
+        for i, (tex_string, glyph_config) in enumerate(specs):
+            cached = get_decimal_glyph(tex_string, glyph_config)
+            old = glyphs[min(i, len(glyphs) - 1)]
+            if i < len(glyphs) and copy_glyph_points(cached, old):
+                new_glyphs.append(old)
+            else:
+                new_glyphs.append(cached.copy().match_style(old))
+        for mob in glyphs:
+            if mob not in new_glyphs:
+                # Dumb hack...due to how scene handles families
+                # of animated mobjects
+                for submob in mob.get_family():
+                    submob.points[:] = 0
+                    submob.note_changed_points()
+
+        self.submobjects = new_glyphs
+        self.arrange_glyphs(num_string)
+        self.scale(last_height / self[-1].get_height())
+        self.move_to(anchor, self.edge_to_fix)
+        if background is not None:
+            background.replace(self, stretch=True)
+            self.add_to_back(background)
+        self.number = number
+        return self
+
+    def rebuild_with_value(self, number, **config):
         full_config = dict(self.CONFIG)
         full_config.update(self.initial_config)
         full_config.update(config)
@@ -119,6 +199,7 @@ class DecimalNumber(VMobject):
             # Dumb hack...due to how scene handles families
             # of animated mobjects
             mob.points[:] = 0
+            mob.note_changed_points()
         self.number = number
         return self
 
@@ -1,4 +1,5 @@
-import html
+import copy
+import hashlib
 from ...constants import *
 from ...container import Container
 from ...mobject.geometry import RoundedRectangle
@@ -10,6 +11,7 @@ import re
 from pygments import highlight
 from pygments.lexers import get_lexer_by_name
 from pygments.formatters.html import HtmlFormatter
+from pygments.styles import get_style_by_name
 
 """
 1) Code is VGroup() with three things
@@ -30,6 +32,11 @@ from pygments.formatters.html import HtmlFormatter
 """
 
 
+# Highlighted code and line number mobjects, keyed by a hash of the code and
+# every setting that affects them.  Code objects get copies of the entries.
+CODE_MOBJECT_CACHE = {}
+
+
 class Code(VGroup):
     CONFIG = {
         "tab_width": 3,
@@ -55,14 +62,13 @@ class Code(VGroup):
         self.file_name = file_name or self.file_name
         self.ensure_valid_file()
         self.style = self.style.lower()
-        self.gen_html_string()
-        strati = self.html_string.find("background:")
-        self.background_color = self.html_string[strati + 12 : strati + 19]
-        self.gen_code_json()
+        with open(self.file_path, "r") as file:
+            self.code_string = file.read()
+        if self.generate_html_file:
+            self.gen_html_string()
 
-        self.code = self.gen_colored_lines()
+        self.gen_code_mobjects()
         if self.insert_line_no:
-            self.line_numbers = self.gen_line_numbers()
             self.line_numbers.next_to(self.code, direction=LEFT, buff=self.line_no_buff)
 
         if self.background == "rectangle":
@@ -153,6 +159,51 @@ class Code(VGroup):
                 return
         raise IOError("No file matching %s in codes directory" % self.file_name)
 
+    def get_cache_key(self):
+        hasher = hashlib.sha256()
+        hasher.update(self.code_string.encode())
+        return (
+            hasher.hexdigest(),
+            self.language,
+            self.style,
+            self.font,
+            self.tab_width,
+            self.line_spacing,
+            self.scale_factor,
+            self.stroke_width,
+            self.indentation_char,
+            self.insert_line_no,
+            self.line_no_from,
+        )
+
+    def gen_code_mobjects(self):
+        key = self.get_cache_key()
+        if key not in CODE_MOBJECT_CACHE:
+            self.gen_code_json()
+            code = self.gen_colored_lines()
+            line_numbers = self.gen_line_numbers() if self.insert_line_no else None
+            CODE_MOBJECT_CACHE[key] = (
+                self.background_color,
+                self.default_color,
+                self.code_json,
+                self.tab_spaces,
+                code,
+                line_numbers,
+            )
+        (
+            self.background_color,
+            self.default_color,
+            self.code_json,
+            self.tab_spaces,
+            code,
+            line_numbers,
+        ) = CODE_MOBJECT_CACHE[key]
+        self.code_json = copy.deepcopy(self.code_json)
+        self.tab_spaces = list(self.tab_spaces)
+        self.code = code.copy()
+        if line_numbers is not None:
+            self.line_numbers = line_numbers.copy()
+
     def gen_line_numbers(self):
         line_numbers_array = []
         for line_no in range(0, self.code_json.__len__()):
@@ -194,157 +245,86 @@ class Code(VGroup):
         return code
 
     def gen_html_string(self):
-        file = open(self.file_path, "r")
-        code_str = file.read()
-        file.close()
         self.html_string = hilite_me(
-            code_str,
+            self.code_string,
             self.language,
             {},
             self.style,
             self.insert_line_no,
             "border:solid gray;border-width:.1em .1em .1em .8em;padding:.2em .6em;",
         )
-        if self.generate_html_file:
-            os.makedirs(
-                os.path.join("assets", "codes", "generated_html_files"), exist_ok=True
-            )
-            file = open(
-                os.path.join(
-                    "assets", "codes", "generated_html_files", self.file_name + ".html"
-                ),
-                "w",
-            )
-            file.write(self.html_string)
-            file.close()
+        os.makedirs(
+            os.path.join("assets", "codes", "generated_html_files"), exist_ok=True
+        )
+        file = open(
+            os.path.join(
+                "assets", "codes", "generated_html_files", self.file_name + ".html"
+            ),
+            "w",
+        )
+        file.write(self.html_string)
+        file.close()
 
     def gen_code_json(self):
-        if (
-            self.background_color == "#111111"
-            or self.background_color == "#272822"
-            or self.background_color == "#202020"
-            or self.background_color == "#000000"
-        ):
+        """Split the Pygments token stream into colored words per line.
+
+        Fills ``code_json`` with a list of ``[text, color]`` pairs per line and
+        ``tab_spaces`` with the indentation level of each line.  Blank lines,
+        including those holding only whitespace, are kept as empty lines.
+        """
+        style = get_style_by_name(self.style)
+        self.background_color = style.background_color
+        if self.background_color in ["#111111", "#272822", "#202020", "#000000"]:
             self.default_color = "#ffffff"
         else:
             self.default_color = "#000000"
-        for i in range(3, -1, -1):
-            self.html_string = self.html_string.replace("</" + " " * i, "</")
-        for i in range(10, -1, -1):
-            self.html_string = self.html_string.replace(
-                "</span>" + " " * i, " " * i + "</span>"
-            )
-        self.html_string = self.html_string.replace("background-color:", "background:")
 
-        if self.insert_line_no:
-            start_point = self.html_string.find("</td><td><pre")
-            start_point = start_point + 9
-        else:
-            start_point = self.html_string.find("<pre")
-        self.html_string = self.html_string[start_point:]
-        # print(self.html_string)
-        lines = self.html_string.split("\n")
-        lines = lines[0 : lines.__len__() - 2]
-        start_point = lines[0].find(">")
-        lines[0] = lines[0][start_point + 1 :]
-        # print(lines)
+        lexer = get_lexer_by_name(self.language)
+        lines = [[]]
+        for token_type, value in lexer.get_tokens(self.code_string):
+            color = style.style_for_token(token_type)["color"]
+            color = "#" + color if color else self.default_color
+            for part_index, part in enumerate(value.split("\n")):
+                if part_index > 0:
+                    lines.append([])
+                if part != "":
+                    lines[-1].append([part, color])
+
+        # The lexer ends the code with a newline, which starts no line
+        if lines[-1] == []:
+            lines.pop()
+
         self.code_json = []
         self.tab_spaces = []
-        code_json_line_index = -1
-        for line_index in range(0, lines.__len__()):
-            if lines[line_index].__len__() == 0:
+        for words in lines:
+            if "".join(word[0] for word in words).strip() == "":
+                self.tab_spaces.append(0)
+                self.code_json.append([])
                 continue
-            # print(lines[line_index])
-            self.code_json.append([])
-            code_json_line_index = code_json_line_index + 1
-            if lines[line_index].startswith(self.indentation_char):
-                start_point = lines[line_index].find("<")
-                starting_string = lines[line_index][:start_point]
-                indentation_char_count = lines[line_index][:start_point].count(
-                    self.indentation_char
-                )
-                if (
-                    starting_string.__len__()
-                    != indentation_char_count * self.indentation_char.__len__()
-                ):
-                    lines[line_index] = (
-                        "\t" * indentation_char_count
-                        + starting_string[
-                            starting_string.rfind(self.indentation_char)
-                            + self.indentation_char.__len__() :
-                        ]
-                        + lines[line_index][start_point:]
-                    )
-                else:
-                    lines[line_index] = (
-                        "\t" * indentation_char_count + lines[line_index][start_point:]
-                    )
-
-            indentation_char_count = 0
-            while lines[line_index][indentation_char_count] == "\t":
-                indentation_char_count = indentation_char_count + 1
-            self.tab_spaces.append(indentation_char_count)
-            # print(lines[line_index])
-            lines[line_index] = self.correct_non_span(lines[line_index])
-            # print(lines[line_index])
-            words = lines[line_index].split("<span")
-            for word_index in range(1, words.__len__()):
-                color_index = words[word_index].find("color:")
-                if color_index == -1:
-                    color = self.default_color
-                else:
-                    starti = words[word_index][color_index:].find("#")
-                    color = words[word_index][
-                        color_index + starti : color_index + starti + 7
-                    ]
-
-                start_point = words[word_index].find(">")
-                end_point = words[word_index].find("</span>")
-                text = words[word_index][start_point + 1 : end_point]
-                text = html.unescape(text)
-                if text != "":
-                    # print(text, "'" + color + "'")
-                    self.code_json[code_json_line_index].append([text, color])
-        # print(self.code_json)
-
-    def correct_non_span(self, line_str):
-        words = line_str.split("</span>")
-        line_str = ""
-        for i in range(0, words.__len__()):
-            if i != words.__len__() - 1:
-                j = words[i].find("<span")
+            self.tab_spaces.append(self.strip_indentation(words))
+            self.code_json.append(words)
+
+    def strip_indentation(self, words):
+        """Remove the leading indentation of a line from its words in place.
+
+        Returns the indentation level, counting both tabs and occurrences of
+        ``indentation_char``.
+        """
+        indentation = 0
+        while words:
+            text = words[0][0]
+            if text.startswith("\t"):
+                text = text[1:]
+            elif text.startswith(self.indentation_char):
+                text = text[len(self.indentation_char) :]
+            else:
+                break
+            indentation += 1
+            if text == "":
+                words.pop(0)
             else:
-                j = words[i].__len__()
-            temp = ""
-            starti = -1
-            for k in range(0, j):
-                if words[i][k] == "\t" and starti == -1:
-                    continue
-                else:
-                    if starti == -1:
-                        starti = k
-                    temp = temp + words[i][k]
-            if temp != "":
-                if i != words.__len__() - 1:
-                    temp = (
-                        '<span style="color:'
-                        + self.default_color
-                        + '">'
-                        + words[i][starti:j]
-                        + "</span>"
-                    )
-                else:
-                    temp = (
-                        '<span style="color:'
-                        + self.default_color
-                        + '">'
-                        + words[i][starti:j]
-                    )
-                temp = temp + words[i][j:]
-                words[i] = temp
-            if words[i] != "":
-                line_str = line_str + words[i] + "</span>"
-        return line_str
+                words[0][0] = text
+        return indentation
 
 
 def hilite_me(code, lexer, options, style, linenos, divstyles):
@@ -1,21 +1,80 @@
 import re
-import os
 import copy
-import hashlib
 import cairo
 
 from ...constants import *
-from ...config import config, file_writer_config
+from ...config import config
 from ...container import Container
 from ...logger import logger
 from ...mobject.geometry import Dot, Rectangle
 from ...mobject.svg.svg_mobject import SVGMobject
 from ...mobject.types.vectorized_mobject import VGroup
+from ...mobject.types.vectorized_mobject import VMobject
+from ...utils.bezier import interpolate
 from ...utils.config_ops import digest_config
 
 
 TEXT_MOB_SCALE_FACTOR = 0.05
 
+# Bezier outlines of single glyphs drawn at the origin, keyed by
+# (font, slant, weight, size, glyph index).  The arrays are read-only and
+# shared by every occurrence of the glyph.
+GLYPH_OUTLINE_CACHE = {}
+_glyph_context = None
+
+
+def get_glyph_context():
+    """Return the cairo context used to lay out and outline glyphs in memory."""
+    global _glyph_context
+    if _glyph_context is None:
+        surface = cairo.RecordingSurface(cairo.CONTENT_ALPHA, None)
+        _glyph_context = cairo.Context(surface)
+    return _glyph_context
+
+
+def cairo_path_to_points(path, nppc=4):
+    """Convert a path from ``cairo.Context.copy_path`` to cubic bezier points.
+
+    Lines become straight cubic curves and every subpath is explicitly closed
+    by a line back to its start, with y flipped to manim's orientation.
+    """
+    points = []
+    start = current = (0, 0)
+    for kind, coords in path:
+        if kind == cairo.PATH_MOVE_TO:
+            start = current = coords
+        elif kind == cairo.PATH_CURVE_TO:
+            points += [current, coords[0:2], coords[2:4], coords[4:6]]
+            current = coords[4:6]
+        else:
+            end = coords if kind == cairo.PATH_LINE_TO else start
+            points += [
+                interpolate(np.array(current), np.array(end), a)
+                for a in np.linspace(0, 1, nppc)
+            ]
+            current = end
+    result = np.zeros((len(points), 3))
+    if points:
+        result[:, :2] = points
+        result[:, 1] *= -1
+    return result
+
+
+def get_glyph_outline(context, font_key, glyph_index):
+    """Return the cached outline of a glyph of the font selected on ``context``.
+
+    ``font_key`` must describe the font currently selected on ``context``.
+    """
+    key = (*font_key, glyph_index)
+    if key not in GLYPH_OUTLINE_CACHE:
+        context.new_path()
+        context.glyph_path([cairo.Glyph(glyph_index, 0, 0)])
+        outline = cairo_path_to_points(context.copy_path())
+        context.new_path()
+        outline.flags.writeable = False
+        GLYPH_OUTLINE_CACHE[key] = outline
+    return GLYPH_OUTLINE_CACHE[key]
+
 
 class TextSetting(object):
     def __init__(self, start, end, font, slant, weight, line_num=-1):
@@ -61,31 +120,12 @@ class Text(SVGMobject):
         self.text = text_without_tabs
         self.lsh = self.size if self.lsh == -1 else self.lsh
 
-        file_name = self.text2svg()
-        self.remove_last_M(file_name)
-        SVGMobject.__init__(self, file_name, **config)
+        VMobject.__init__(self, **config)
         self.apply_front_and_end_spaces()
+        self.move_into_position()
         self.text = text
         self.apply_space_chars()
 
-        nppc = self.n_points_per_cubic_curve
-        for each in self:
-            if len(each.points) == 0:
-                continue
-            points = each.points
-            last = points[0]
-            each.clear_points()
-            for index, point in enumerate(points):
-                each.append_points([point])
-                if (
-                    index != len(points) - 1
-                    and (index + 1) % nppc == 0
-                    and any(point != points[index + 1])
-                ):
-                    each.add_line_to(last)
-                    last = points[index + 1]
-            each.add_line_to(last)
-
         if self.t2c:
             self.set_color_by_t2c()
         if self.gradient:
@@ -97,32 +137,19 @@ class Text(SVGMobject):
         if self.height is None and self.width is None:
             self.scale(TEXT_MOB_SCALE_FACTOR)
 
-    def get_space_width(self):
-        size = self.size * 10
-
-        dir_name = file_writer_config["text_dir"]
-        file_name = os.path.join(dir_name, "space") + ".svg"
+    def generate_points(self):
+        self.add(*self.text2glyphs())
 
-        surface = cairo.SVGSurface(file_name, 600, 400)
-        context = cairo.Context(surface)
-        context.set_font_size(size)
-        context.move_to(START_X, START_Y)
-        context.select_font_face(
-            self.font, self.str2slant(self.slant), self.str2weight(self.weight)
-        )
-        context.move_to(START_X, START_Y)
-        context.show_text("_")
-        surface.finish()
-        svg_with_space = SVGMobject(
-            file_name,
-            height=self.height,
-            width=self.width,
-            stroke_width=self.stroke_width,
-            should_center=self.should_center,
-            unpack_groups=self.unpack_groups,
+    def get_space_width(self):
+        context = get_glyph_context()
+        font_key = self.select_font_face(
+            context, self.font, self.slant, self.weight, self.size * 10
         )
-        space_width = svg_with_space.get_width()
-        return space_width
+        glyph = context.get_scaled_font().text_to_glyphs(0, 0, "_", False)[0]
+        outline = get_glyph_outline(context, font_key, glyph.index)
+        if len(outline) == 0:
+            return 0
+        return np.ptp(outline[:, 0])
 
     def apply_front_and_end_spaces(self):
         space_width = self.get_space_width()
@@ -185,13 +212,6 @@ class Text(SVGMobject):
                 space.move_to(self.submobjects[char_index - 1].get_center())
                 self.submobjects.insert(char_index, space)
 
-    def remove_last_M(self, file_name):
-        with open(file_name, "r") as fpr:
-            content = fpr.read()
-        content = re.sub(r'Z M [^A-Za-z]*? "\/>', 'Z "/>', content)
-        with open(file_name, "w") as fpw:
-            fpw.write(content)
-
     def find_indexes(self, word):
         m = re.match(r"\[([0-9\-]{0,}):([0-9\-]{0,})\]", word)
         if m:
@@ -249,15 +269,6 @@ class Text(SVGMobject):
         if string == BOLD:
             return cairo.FontWeight.BOLD
 
-    def text2hash(self):
-        settings = self.font + self.slant + self.weight
-        settings += str(self.t2f) + str(self.t2s) + str(self.t2w)
-        settings += str(self.lsh) + str(self.size)
-        id_str = self.text + settings
-        hasher = hashlib.sha256()
-        hasher.update(id_str.encode())
-        return hasher.hexdigest()[:16]
-
     def text2settings(self):
         settings = []
         t2x = [self.t2f, self.t2s, self.t2w]
@@ -304,7 +315,19 @@ class Text(SVGMobject):
 
         return settings
 
-    def text2svg(self):
+    def select_font_face(self, context, font, slant, weight, size):
+        """Select a font on ``context`` and return its key in the glyph cache."""
+        font_key = (font, self.str2slant(slant), self.str2weight(weight), size)
+        context.select_font_face(*font_key[:3])
+        context.set_font_size(size)
+        return font_key
+
+    def text2glyphs(self):
+        """Lay out the text from cached glyph outlines, one VMobject per glyph.
+
+        Glyphs are positioned with cairo's in-memory text layout, so no SVG file
+        is written or parsed.  Whitespace has no outline and yields no glyph.
+        """
         # anti-aliasing
         size = self.size * 10
         lsh = self.lsh * 10
@@ -313,35 +336,34 @@ class Text(SVGMobject):
             if NOT_SETTING_FONT_MSG != "":
                 logger.warning(NOT_SETTING_FONT_MSG)
 
-        dir_name = file_writer_config["text_dir"]
-        hash_name = self.text2hash()
-        file_name = os.path.join(dir_name, hash_name) + ".svg"
-        if os.path.exists(file_name):
-            return file_name
-
-        surface = cairo.SVGSurface(file_name, 600, 400)
-        context = cairo.Context(surface)
-        context.set_font_size(size)
-        context.move_to(START_X, START_Y)
-
+        context = get_glyph_context()
         settings = self.text2settings()
+        glyphs = []
         offset_x = 0
         last_line_num = 0
         for setting in settings:
-            font = setting.font
-            slant = self.str2slant(setting.slant)
-            weight = self.str2weight(setting.weight)
+            font_key = self.select_font_face(
+                context, setting.font, setting.slant, setting.weight, size
+            )
             text = self.text[setting.start : setting.end].replace("\n", " ")
 
-            context.select_font_face(font, slant, weight)
             if setting.line_num != last_line_num:
                 offset_x = 0
                 last_line_num = setting.line_num
-            context.move_to(START_X + offset_x, START_Y + lsh * setting.line_num)
-            context.show_text(text)
-            offset_x += context.text_extents(text)[4]
-
-        return file_name
+            scaled_font = context.get_scaled_font()
+            for glyph in scaled_font.text_to_glyphs(
+                START_X + offset_x, START_Y + lsh * setting.line_num, text, False
+            ):
+                outline = get_glyph_outline(context, font_key, glyph.index)
+                if len(outline) == 0:
+                    continue
+                glyph_mob = VMobject()
+                # cairo's y axis points down
+                glyph_mob.points = outline + np.array([glyph.x, -glyph.y, 0])
+                glyphs.append(glyph_mob)
+            offset_x += scaled_font.text_extents(text).x_advance
+
+        return glyphs
 
 
 class TextWithFixHeight(Text):
@@ -54,3 +54,43 @@ def get_3d_vmob_start_corner_unit_normal(vmob):
 
 def get_3d_vmob_end_corner_unit_normal(vmob):
     return get_3d_vmob_unit_normal(vmob, get_3d_vmob_end_corner_index(vmob))
+
+
+def get_3d_vmobs_corners_and_unit_normals(vmobs):
+    """Batched version of the start and end corner functions above.
+
+    Returns
+    -------
+    tuple
+        Two arrays of shape (len(vmobs), 2, 3), holding the start and end
+        corners of each vmobject and their unit normals.
+    """
+    lengths = np.array([len(vmob.points) for vmob in vmobs], dtype=int)
+    if lengths.sum() == 0:
+        corners = np.zeros((len(vmobs), 2, 3))
+        return corners, corners + UP
+    nppcs = np.array([vmob.n_points_per_cubic_curve for vmob in vmobs])
+    offsets = np.cumsum(lengths) - lengths
+    all_points = np.vstack([vmob.points for vmob in vmobs if len(vmob.points) > 0])
+    last_index = len(all_points) - 1
+
+    def get_points(indices):
+        return all_points[np.clip(offsets[:, np.newaxis] + indices, 0, last_index)]
+
+    n_points = lengths[:, np.newaxis]
+    corner_indices = np.zeros((len(vmobs), 2), dtype=int)
+    corner_indices[:, 1] = ((lengths - 1) // 6) * 3
+    im3 = np.where(corner_indices > 2, corner_indices - 3, n_points - 4)
+    ip3 = np.where(corner_indices < n_points - 3, corner_indices + 3, 3)
+
+    corners = get_points(corner_indices)
+    unit_normals = np.cross(get_points(ip3) - corners, get_points(im3) - corners)
+    norms = np.linalg.norm(unit_normals, axis=2)
+    # Those with at most two anchors have no well defined normal
+    few_anchors = (lengths == 1) | (lengths // nppcs <= 1)
+    use_up = few_anchors[:, np.newaxis] | (norms == 0)
+    norms[use_up] = 1
+    unit_normals /= norms[:, :, np.newaxis]
+    unit_normals[use_up] = UP
+    corners[lengths == 0] = ORIGIN
+    return corners, unit_normals
@@ -388,6 +388,7 @@ class VMobject(Mobject):
         arrays = [anchors1, handles1, handles2, anchors2]
         for index, array in enumerate(arrays):
             self.points[index::nppcc] = array
+        self.note_changed_points()
         return self
 
     def clear_points(self):
@@ -22,6 +22,7 @@ class ValueTracker(Mobject):
 
     def set_value(self, value):
         self.points[0, 0] = value
+        self.note_changed_points()
         return self
 
     def increment_value(self, d_value):
@@ -57,4 +58,5 @@ class ComplexValueTracker(ValueTracker):
     def set_value(self, z):
         z = complex(z)
         self.points[0, :2] = (z.real, z.imag)
+        self.note_changed_points()
         return self
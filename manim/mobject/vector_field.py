@@ -1,3 +1,4 @@
+import hashlib
 import numpy as np
 import os
 import itertools as it
@@ -5,7 +6,7 @@ from PIL import Image
 import random
 
 from ..constants import *
-from ..config import config
+from ..config import config, file_writer_config
 from ..logger import logger
 from ..animation.composition import AnimationGroup
 from ..animation.indication import ShowPassingFlash
@@ -17,6 +18,7 @@ from ..utils.bezier import interpolate
 from ..utils.color import color_to_rgb
 from ..utils.color import rgb_to_color
 from ..utils.config_ops import digest_config
+from ..utils.file_ops import guarantee_existence
 from ..utils.rate_functions import linear
 from ..utils.simple_functions import sigmoid
 from ..utils.space_ops import get_norm
@@ -27,28 +29,32 @@ from ..utils.space_ops import get_norm
 DEFAULT_SCALAR_FIELD_COLORS = [BLUE_E, GREEN, YELLOW, RED]
 
 
+def evaluate_scalar_field(scalar_field_func, points, vectorized=False):
+    """Evaluates scalar_field_func at each of an (N, 3) array of points.
+    If vectorized, the function is called once with the whole array."""
+    if vectorized:
+        return np.array(scalar_field_func(points), dtype=float).reshape(len(points))
+    return np.apply_along_axis(scalar_field_func, 1, points)
+
+
 def get_colored_background_image(
     scalar_field_func,
     number_to_rgb_func,
     pixel_height=config["pixel_height"],
     pixel_width=config["pixel_width"],
+    vectorized=False,
 ):
-    ph = config["pixel_height"]
-    pw = config["pixel_width"]
+    ph = pixel_height
+    pw = pixel_width
     fw = config["frame_width"]
     fh = config["frame_height"]
     points_array = np.zeros((ph, pw, 3))
-    x_array = np.linspace(-fw / 2, fw / 2, pw)
-    x_array = x_array.reshape((1, len(x_array)))
-    x_array = x_array.repeat(ph, axis=0)
-
-    y_array = np.linspace(fh / 2, -fh / 2, ph)
-    y_array = y_array.reshape((len(y_array), 1))
-    y_array.repeat(pw, axis=1)
-    points_array[:, :, 0] = x_array
-    points_array[:, :, 1] = y_array
-    scalars = np.apply_along_axis(scalar_field_func, 2, points_array)
-    rgb_array = number_to_rgb_func(scalars.flatten()).reshape((ph, pw, 3))
+    points_array[:, :, 0] = np.linspace(-fw / 2, fw / 2, pw)[np.newaxis, :]
+    points_array[:, :, 1] = np.linspace(fh / 2, -fh / 2, ph)[:, np.newaxis]
+    scalars = evaluate_scalar_field(
+        scalar_field_func, points_array.reshape((ph * pw, 3)), vectorized
+    )
+    rgb_array = number_to_rgb_func(scalars).reshape((ph, pw, 3))
     return Image.fromarray((rgb_array * 255).astype("uint8"))
 
 
@@ -74,23 +80,50 @@ def get_rgb_gradient_function(
 
 
 def get_color_field_image_file(
-    scalar_func, min_value=0, max_value=2, colors=DEFAULT_SCALAR_FIELD_COLORS
+    scalar_func,
+    min_value=0,
+    max_value=2,
+    colors=DEFAULT_SCALAR_FIELD_COLORS,
+    vectorized=False,
 ):
-    # try_hash
-    np.random.seed(0)
-    sample_inputs = 5 * np.random.random(size=(10, 3)) - 10
-    sample_outputs = np.apply_along_axis(scalar_func, 1, sample_inputs)
-    func_hash = hash(
-        str(min_value) + str(max_value) + str(colors) + str(sample_outputs)
+    """Returns the path of an image coloring the frame by the values of
+    scalar_func, rendering it only if it isn't cached yet.
+
+    Functions can't be hashed, so the image is identified by the values of
+    scalar_func at a few sample points, along with the coloring and the
+    resolution it is rendered at.  If vectorized, scalar_func is given an
+    (N, 3) array of points at once.
+    """
+    sample_inputs = 5 * np.random.RandomState(0).random_sample(size=(10, 3)) - 10
+    sample_outputs = evaluate_scalar_field(scalar_func, sample_inputs, vectorized)
+    ph = config["pixel_height"]
+    pw = config["pixel_width"]
+    func_hash = hashlib.sha256(
+        repr(
+            (
+                min_value,
+                max_value,
+                [str(color) for color in colors],
+                np.round(sample_outputs, 8).tolist(),
+                ph,
+                pw,
+                config["frame_height"],
+                config["frame_width"],
+            )
+        ).encode()
+    ).hexdigest()[:16]
+    color_field_dir = guarantee_existence(
+        os.path.join(file_writer_config["media_dir"], "color_fields")
     )
-    file_name = "%d.png" % func_hash
-    full_path = os.path.join(RASTER_IMAGE_DIR, file_name)
+    full_path = os.path.join(color_field_dir, func_hash + ".png")
     if not os.path.exists(full_path):
-        logger.info("Rendering color field image " + str(func_hash))
+        logger.info("Rendering color field image " + func_hash)
         rgb_gradient_func = get_rgb_gradient_function(
             min_value=min_value, max_value=max_value, colors=colors
         )
-        image = get_colored_background_image(scalar_func, rgb_gradient_func)
+        image = get_colored_background_image(
+            scalar_func, rgb_gradient_func, ph, pw, vectorized=vectorized
+        )
         image.save(full_path)
     return full_path
 
@@ -0,0 +1,97 @@
+"""
+frame_buffer_pool.py
+--------------------
+
+The pixel arrays the frames of a scene are rendered into.
+
+The camera of a scene renders each frame into a free buffer of a
+:class:`FrameBufferPool`, and the frame is handed over to the file writer by
+reference instead of being copied.  Whatever keeps a frame after it was
+written, e.g. an encoder queue, holds its buffer until it is done with it, so
+the buffer is not rendered into again in the meantime.
+"""
+import threading
+
+import numpy as np
+
+from ..logger import logger
+
+__all__ = ["FrameBufferPool"]
+
+
+class FrameBufferPool(object):
+    """Ring of preallocated frame buffers, reused once they are released.
+
+    Each buffer counts the holds on it: it is handed out by
+    :meth:`get_buffer` with one hold, and becomes free again when every
+    :meth:`hold` was matched by a :meth:`release`.  Arrays which are not
+    buffers of the pool may be held and released too, which does nothing.
+
+    Parameters
+    ----------
+    size : :class:`int`, optional
+        The number of buffers allocated at first.  The ring grows when all of
+        its buffers are held.
+    """
+
+    def __init__(self, size=2):
+        self.size = size
+        self.lock = threading.Lock()
+        self.shape = None
+        self.dtype = None
+        self.buffers = []
+        # The number of holds on each buffer, keyed by the id of the buffer
+        self.hold_counts = {}
+        self.next_index = 0
+
+    def get_buffer(self, shape, dtype):
+        """Returns the next free buffer of the ring, holding it once.
+
+        Parameters
+        ----------
+        shape : :class:`tuple`
+            The shape of the frames.
+        dtype : :class:`numpy.dtype`
+            The type of their pixel values.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The buffer, whose content is left from the frame it held before.
+        """
+        with self.lock:
+            if shape != self.shape or dtype != self.dtype:
+                # Forget the buffers of the previous frame size.  Those
+                # still held are released by their holders in vain.
+                self.shape, self.dtype = shape, dtype
+                self.buffers = [np.empty(shape, dtype) for _ in range(self.size)]
+                self.hold_counts = {id(buffer): 0 for buffer in self.buffers}
+                self.next_index = 0
+            for i in range(len(self.buffers)):
+                index = (self.next_index + i) % len(self.buffers)
+                buffer = self.buffers[index]
+                if self.hold_counts[id(buffer)] == 0:
+                    self.next_index = index + 1
+                    break
+            else:
+                buffer = np.empty(shape, dtype)
+                self.buffers.insert(self.next_index, buffer)
+                self.next_index += 1
+                logger.debug(
+                    f"All the frame buffers are in use, allocated buffer "
+                    f"{len(self.buffers)}"
+                )
+            self.hold_counts[id(buffer)] = 1
+            return buffer
+
+    def hold(self, frame):
+        """Keeps the buffer of `frame` from being handed out."""
+        with self.lock:
+            if id(frame) in self.hold_counts:
+                self.hold_counts[id(frame)] += 1
+
+    def release(self, frame):
+        """Releases a hold on the buffer of `frame`."""
+        with self.lock:
+            if self.hold_counts.get(id(frame), 0) > 0:
+                self.hold_counts[id(frame)] -= 1
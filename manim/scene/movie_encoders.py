@@ -0,0 +1,274 @@
+"""
+movie_encoders.py
+-----------------
+
+The backends encoding the frames rendered by a scene into movie files.
+
+:class:`SubprocessEncoder` pipes raw frames to the FFMPEG executable, while
+:class:`PyAVEncoder` encodes them in process with the optional ``av`` package.
+Both take the same encoder settings, which are read from
+``file_writer_config``.
+"""
+from fractions import Fraction
+import queue
+import subprocess
+import threading
+
+import numpy as np
+
+from ..constants import FFMPEG_BIN
+from ..logger import logger
+
+__all__ = ["SubprocessEncoder", "PyAVEncoder", "get_movie_encoder_class"]
+
+# Write the index of the movie first and a fragment at every keyframe, so the
+# frames encoded so far can be played before the file is finished
+FRAGMENTED_MOVFLAGS = "frag_keyframe+empty_moov"
+
+
+class MovieEncoder(object):
+    """Base class of the encoders writing frames into a single movie file.
+
+    Parameters
+    ----------
+    file_path : :class:`str`
+        The path of the movie file to write.
+    width, height : :class:`int`
+        The size of the frames, in pixels.
+    frame_rate : :class:`float`
+        The number of frames per second.
+    transparent : :class:`bool`, optional
+        Whether to keep the alpha channel of the frames.
+    codec : :class:`str`, optional
+        The codec to use.  Defaults to ``qtrle`` for transparent movies and
+        ``libx264`` otherwise.
+    preset, crf : :class:`str`, optional
+        The speed/compression trade-off and quality of x264 like codecs.
+    gop_size : :class:`int`, optional
+        The maximum number of frames between keyframes.
+    threads : :class:`int`, optional
+        The number of threads of the codec.
+    max_b_frames : :class:`int`, optional
+        The maximum number of consecutive B-frames.
+    loglevel : :class:`str`, optional
+        The log level of FFMPEG.
+    fragmented : :class:`bool`, optional
+        Whether to write a fragmented movie, which can be played while it is
+        being written.
+    frame_pool : :class:`~.FrameBufferPool`, optional
+        The pool of the frames, which are held while the encoder keeps them.
+
+    Options left to None use the default of the codec.
+    """
+
+    def __init__(
+        self,
+        file_path,
+        width,
+        height,
+        frame_rate,
+        transparent=False,
+        codec=None,
+        preset=None,
+        crf=None,
+        gop_size=None,
+        threads=None,
+        max_b_frames=None,
+        loglevel="error",
+        fragmented=False,
+        frame_pool=None,
+    ):
+        self.file_path = file_path
+        self.width = width
+        self.height = height
+        self.frame_rate = frame_rate
+        self.transparent = transparent
+        if codec is None:
+            codec = "qtrle" if transparent else "libx264"
+        self.codec = codec
+        self.pix_fmt = "argb" if transparent else "yuv420p"
+        self.preset = preset
+        self.crf = crf
+        self.gop_size = gop_size
+        self.threads = threads
+        self.max_b_frames = max_b_frames
+        self.loglevel = loglevel
+        self.fragmented = fragmented
+        self.frame_pool = frame_pool
+
+    def write_frame(self, frame):
+        """Encodes a frame, given as an RGBA pixel array."""
+        raise NotImplementedError()
+
+    def close(self):
+        """Encodes the remaining frames and finishes the file."""
+        raise NotImplementedError()
+
+    def terminate(self):
+        """Stops encoding without finishing the file."""
+        raise NotImplementedError()
+
+
+class SubprocessEncoder(MovieEncoder):
+    """Encoder piping the frames to an FFMPEG process."""
+
+    def __init__(self, file_path, width, height, frame_rate, **kwargs):
+        super().__init__(file_path, width, height, frame_rate, **kwargs)
+        command = [
+            FFMPEG_BIN,
+            "-y",  # overwrite output file if it exists
+            "-f",
+            "rawvideo",
+            "-s",
+            "%dx%d" % (width, height),  # size of one frame
+            "-pix_fmt",
+            "rgba",
+            "-r",
+            str(frame_rate),  # frames per second
+            "-i",
+            "-",  # The imput comes from a pipe
+            "-an",  # Tells FFMPEG not to expect any audio
+            "-loglevel",
+            self.loglevel,
+            "-vcodec",
+            self.codec,
+        ]
+        # qtrle picks a pixel format with alpha by itself
+        if not self.transparent:
+            command += ["-pix_fmt", self.pix_fmt]
+        for flag, value in [
+            ("-preset", self.preset),
+            ("-crf", self.crf),
+            ("-g", self.gop_size),
+            ("-threads", self.threads),
+            ("-bf", self.max_b_frames),
+        ]:
+            if value is not None:
+                command += [flag, str(value)]
+        if self.fragmented:
+            command += ["-movflags", FRAGMENTED_MOVFLAGS]
+        command += [file_path]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write_frame(self, frame):
+        # Write the memory of the frame, without copying it to bytes first
+        self.process.stdin.write(np.ascontiguousarray(frame).data)
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+    def terminate(self):
+        self.process.terminate()
+
+
+class PyAVEncoder(MovieEncoder):
+    """Encoder running the codec in process through PyAV.
+
+    The frames are converted from RGBA and encoded by a worker thread, so
+    that rendering goes on meanwhile.  At most ``queue_size`` frames wait to
+    be encoded; they are kept by reference, so they must not be modified
+    once written, which ``frame_pool`` ensures for its buffers.
+    """
+
+    def __init__(self, file_path, width, height, frame_rate, queue_size=8, **kwargs):
+        import av
+
+        super().__init__(file_path, width, height, frame_rate, **kwargs)
+        self.av = av
+        options = {}
+        for key, value in [
+            ("preset", self.preset),
+            ("crf", self.crf),
+            ("bf", self.max_b_frames),
+        ]:
+            if value is not None:
+                options[key] = str(value)
+        container_options = {}
+        if self.fragmented:
+            container_options["movflags"] = FRAGMENTED_MOVFLAGS
+        self.container = av.open(file_path, mode="w", options=container_options)
+        self.stream = self.container.add_stream(
+            self.codec,
+            rate=Fraction(frame_rate).limit_denominator(1001),
+            options=options,
+        )
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = self.pix_fmt
+        if self.gop_size is not None:
+            self.stream.codec_context.gop_size = int(self.gop_size)
+        if self.threads is not None:
+            self.stream.codec_context.thread_count = int(self.threads)
+
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.worker = threading.Thread(target=self.encode_frames, daemon=True)
+        self.worker.start()
+
+    def encode_frames(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                break
+            if self.error is None:
+                try:
+                    video_frame = self.av.VideoFrame.from_ndarray(frame, format="rgba")
+                    video_frame = video_frame.reformat(format=self.pix_fmt)
+                    self.container.mux(self.stream.encode(video_frame))
+                except Exception as error:
+                    self.error = error
+            # After an error, keep emptying the queue, so the render thread
+            # never blocks
+            if self.frame_pool is not None:
+                self.frame_pool.release(frame)
+        if self.error is None:
+            try:
+                # Flush the frames delayed by the codec
+                self.container.mux(self.stream.encode(None))
+            except Exception as error:
+                self.error = error
+
+    def raise_worker_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def write_frame(self, frame):
+        self.raise_worker_error()
+        if self.frame_pool is not None:
+            self.frame_pool.hold(frame)
+        self.frames.put(frame)
+
+    def close(self):
+        self.frames.put(None)
+        self.worker.join()
+        self.container.close()
+        self.raise_worker_error()
+
+    def terminate(self):
+        self.error = self.error or InterruptedError("Encoding was terminated")
+        self.frames.put(None)
+        self.worker.join()
+        self.container.close()
+
+
+def get_movie_encoder_class(backend):
+    """Returns the encoder class of a backend name, "subprocess" or "pyav".
+
+    Falls back to :class:`SubprocessEncoder` when PyAV is not installed.
+    """
+    if backend == "pyav":
+        try:
+            import av
+        except ImportError:
+            logger.warning(
+                "The pyav encoder needs the av package. "
+                "Falling back to the subprocess encoder."
+            )
+            return SubprocessEncoder
+        return PyAVEncoder
+    if backend != "subprocess":
+        logger.warning(
+            f"Unknown encoder {backend}. Falling back to the subprocess encoder."
+        )
+    return SubprocessEncoder
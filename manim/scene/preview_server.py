@@ -0,0 +1,210 @@
+"""
+preview_server.py
+-----------------
+
+A server streaming the frames of a scene while it renders, so the render can
+be watched without waiting for the movie file.
+
+It only listens on localhost and serves two streams over HTTP:
+
+``/``
+    Motion JPEG, which can be watched in a web browser or with
+    ``ffplay http://127.0.0.1:<port>/``.
+``/raw``
+    Raw RGBA frames, for players reading raw video such as ``ffplay -f
+    rawvideo -pixel_format rgba -video_size <width>x<height> <url>``.
+
+Each client is sent the latest frame whenever it is ready for one, so the
+frames rendered in the meantime are dropped for the clients slower than the
+render, and the render never waits for them.
+"""
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import io
+import socketserver
+import threading
+
+from PIL import Image
+
+from ..logger import logger
+
+__all__ = ["PreviewServer"]
+
+
+class PreviewRequestHandler(BaseHTTPRequestHandler):
+    """Sends the frames of the preview of ``self.server.preview``."""
+
+    def do_GET(self):
+        preview = self.server.preview
+        if self.path == "/":
+            content_type = "multipart/x-mixed-replace; boundary=frame"
+            frame_format = "jpeg"
+        elif self.path == "/raw":
+            content_type = "application/octet-stream"
+            frame_format = "raw"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        frame_number = 0
+        try:
+            while True:
+                frame_number, data = preview.wait_for_frame(frame_number, frame_format)
+                if data is None:
+                    break
+                if frame_format == "jpeg":
+                    self.wfile.write(
+                        b"--frame\r\nContent-Type: image/jpeg\r\n"
+                        b"Content-Length: %d\r\n\r\n" % len(data)
+                    )
+                    data += b"\r\n"
+                self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away
+            pass
+
+    def log_message(self, format, *args):
+        logger.debug("Live preview: " + format % args)
+
+
+class PreviewHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """HTTP server serving each client in its own thread."""
+
+    daemon_threads = True
+
+
+class PreviewServer(object):
+    """Streams the frames given to :meth:`send_frame` to localhost clients.
+
+    Parameters
+    ----------
+    width, height : :class:`int`
+        The size of the rendered frames, in pixels.
+    frame_rate : :class:`float`
+        The number of frames per second of the scene.
+    port : :class:`int`, optional
+        The port to listen on.
+    scale : :class:`float`, optional
+        The factor by which the frames are scaled down before being sent.
+    jpeg_quality : :class:`int`, optional
+        The quality of the JPEG frames, from 1 to 95.
+    frame_pool : :class:`~.FrameBufferPool`, optional
+        The pool of the frames, which are held while the server keeps them.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        frame_rate,
+        port=8090,
+        scale=0.5,
+        jpeg_quality=80,
+        frame_pool=None,
+    ):
+        self.size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        self.frame_rate = frame_rate
+        self.jpeg_quality = jpeg_quality
+        self.frame_pool = frame_pool
+        self.condition = threading.Condition()
+        self.frame = None
+        self.frame_number = 0
+        # The frames are converted by the clients, in their own threads.  The
+        # latest conversion of each kind is shared by all of them.
+        self.encoded_frames = {}
+        self.closed = False
+        self.server = PreviewHTTPServer(("127.0.0.1", port), PreviewRequestHandler)
+        self.server.preview = self
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        url = "http://127.0.0.1:%d" % self.server.server_port
+        logger.info(
+            f"Live preview at {url}/ (or raw {self.size[0]}x{self.size[1]} "
+            f"RGBA frames at {self.frame_rate} fps at {url}/raw)"
+        )
+
+    def send_frame(self, frame):
+        """Makes `frame` the latest frame of the stream.
+
+        The frame is kept by reference, so it must not be modified afterwards;
+        buffers of ``frame_pool`` are held until they are replaced.
+        """
+        with self.condition:
+            self.hold_frame(frame)
+            self.release_frame(self.frame)
+            self.frame = frame
+            self.frame_number += 1
+            self.encoded_frames = {}
+            self.condition.notify_all()
+
+    def wait_for_frame(self, frame_number, frame_format):
+        """Waits for a frame newer than `frame_number` and converts it.
+
+        Parameters
+        ----------
+        frame_number : :class:`int`
+            The number of the last frame the client received.
+        frame_format : :class:`str`
+            The format to convert the frame to, "jpeg" or "raw".
+
+        Returns
+        -------
+        tuple
+            The number of the latest frame and its bytes, which are None once
+            the server is closed.
+        """
+        with self.condition:
+            while self.frame_number <= frame_number and not self.closed:
+                self.condition.wait()
+            if self.closed:
+                return frame_number, None
+            frame_number, frame = self.frame_number, self.frame
+            if frame_format in self.encoded_frames:
+                return frame_number, self.encoded_frames[frame_format]
+            # Keep the frame while converting it, even if a newer one comes
+            self.hold_frame(frame)
+        if frame_format == "jpeg":
+            data = self.get_jpeg(frame)
+        else:
+            data = self.get_raw_frame(frame)
+        with self.condition:
+            self.release_frame(frame)
+            if self.frame_number == frame_number:
+                self.encoded_frames[frame_format] = data
+        return frame_number, data
+
+    def hold_frame(self, frame):
+        if self.frame_pool is not None and frame is not None:
+            self.frame_pool.hold(frame)
+
+    def release_frame(self, frame):
+        if self.frame_pool is not None and frame is not None:
+            self.frame_pool.release(frame)
+
+    def get_image(self, frame):
+        image = Image.fromarray(frame, "RGBA")
+        if image.size != self.size:
+            image = image.resize(self.size, Image.BILINEAR)
+        return image
+
+    def get_jpeg(self, frame):
+        output = io.BytesIO()
+        self.get_image(frame).convert("RGB").save(
+            output, "JPEG", quality=self.jpeg_quality
+        )
+        return output.getvalue()
+
+    def get_raw_frame(self, frame):
+        return self.get_image(frame).tobytes()
+
+    def close(self):
+        """Ends the streams and stops the server."""
+        with self.condition:
+            self.closed = True
+            self.release_frame(self.frame)
+            self.frame = None
+            self.condition.notify_all()
+        self.server.shutdown()
+        self.server.server_close()
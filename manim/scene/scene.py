@@ -3,6 +3,7 @@ import random
 import warnings
 import platform
 import copy
+import zlib
 
 from tqdm import tqdm as ProgressDisplay
 import numpy as np
@@ -15,6 +16,7 @@ from ..config import camera_config, file_writer_config
 from ..container import Container
 from ..logger import logger
 from ..mobject.mobject import Mobject
+from ..scene.frame_buffer_pool import FrameBufferPool
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.iterables import list_update
 from ..utils.hashing import get_hash_from_play_call, get_hash_from_wait_call
@@ -60,6 +62,7 @@ class Scene(Container):
     def __init__(self, **kwargs):
         Container.__init__(self, **kwargs)
         self.camera = self.camera_class(**camera_config)
+        self.frame_pool = FrameBufferPool()
         self.file_writer = SceneFileWriter(self, **file_writer_config,)
         self.play_hashes_list = []
         self.mobjects = []
@@ -162,6 +165,18 @@ class Scene(Container):
         """
         return np.array(self.camera.get_pixel_array())
 
+    def get_frame_buffer(self):
+        """
+        Gets the current frame without copying it, to write it.
+
+        Returns
+        -------
+        np.array
+            The pixel array of the camera, which it won't render into again
+            as long as the frame pool holds it.
+        """
+        return self.camera.get_pixel_array()
+
     def update_frame(  # TODO Description in Docstring
         self,
         mobjects=None,
@@ -191,6 +206,7 @@ class Scene(Container):
             return
         if mobjects is None:
             mobjects = list_update(self.mobjects, self.foreground_mobjects,)
+        self.use_next_frame_buffer()
         if background is not None:
             self.camera.set_pixel_array(background)
         else:
@@ -199,6 +215,19 @@ class Scene(Container):
         kwargs["include_submobjects"] = include_submobjects
         self.camera.capture_mobjects(mobjects, **kwargs)
 
+    def use_next_frame_buffer(self):
+        """
+        Makes the camera render into the next free buffer of the frame pool,
+        so that the frame it held can still be written while the next one
+        renders.  The frames are written by reference, see
+        :meth:`get_frame_buffer`.
+        """
+        pixel_array = self.camera.get_pixel_array()
+        self.camera.pixel_array = self.frame_pool.get_buffer(
+            pixel_array.shape, pixel_array.dtype
+        )
+        self.frame_pool.release(pixel_array)
+
     def freeze_background(self):
         self.update_frame()
         self.camera = Camera(self.get_frame())
@@ -591,6 +620,38 @@ class Scene(Container):
                 return mobjects[i:]
         return []
 
+    def get_mobjects_digest(self, mobjects):
+        """
+        Gets a digest of the state of the passed mobjects and their family,
+        which changes whenever one of them could look different.
+
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects whose state is digested.
+
+        Returns
+        ------
+        int
+            The digest of the arrays (points, colors...) and of the other
+            plain attributes of the mobjects.
+        """
+        digest = 0
+        attributes = []
+        for mob in self.camera.extract_mobject_family_members(mobjects):
+            # Submobjects may be replaced, e.g. by the updaters of DecimalNumber
+            attributes.append(id(mob))
+            for key, value in mob.__dict__.items():
+                if key == "points_version":
+                    # Bumped even when the points are set to the same values
+                    continue
+                if isinstance(value, np.ndarray) and value.dtype != object:
+                    attributes.append((key, value.shape))
+                    digest = zlib.crc32(np.ascontiguousarray(value), digest)
+                elif isinstance(value, (int, float, str)) or value is None:
+                    attributes.append((key, value))
+        return zlib.crc32(repr(attributes).encode(), digest)
+
     def get_time_progression(
         self, run_time, n_iterations=None, override_skip_animations=False
     ):
@@ -634,6 +695,36 @@ class Scene(Container):
         )
         return time_progression
 
+    def get_num_frames(self, run_time):
+        """
+        Gets the number of frames rendered for an animation
+        lasting run_time, as given by get_time_progression.
+
+        Parameters
+        ----------
+        run_time: float
+            The run_time of the animation.
+
+        Returns
+        ------
+        int
+            The number of frames.
+        """
+        return len(np.arange(0, run_time, 1 / self.camera.frame_rate))
+
+    def skip_frames(self, n_frames):
+        """
+        Lets the time of n_frames frames go by without writing them,
+        so that the scene time, and the sounds and frame numbers
+        depending on it, are the same as when they are rendered.
+
+        Parameters
+        ----------
+        n_frames: int
+            The number of frames to skip.
+        """
+        self.increment_time(n_frames / self.camera.frame_rate)
+
     def get_run_time(self, animations):
         """
         Gets the total run time for a list of animations.
@@ -775,7 +866,9 @@ class Scene(Container):
 
         if file_writer_config["from_animation_number"]:
             if self.num_plays == file_writer_config["from_animation_number"]:
-                file_writer_config["skip_animations"] = False
+                # Render this animation and the following ones
+                self.original_skipping_status = file_writer_config["save_last_frame"]
+                file_writer_config["skip_animations"] = self.original_skipping_status
         if file_writer_config["upto_animation_number"]:
             if self.num_plays >= file_writer_config["upto_animation_number"]:
                 file_writer_config["skip_animations"] = True
@@ -790,14 +883,20 @@ class Scene(Container):
         Parameters
         ----------
         func : Callable[[...], None]
-            The play like function that has to be written to the video file stream. Take the same parameters as `scene.play`.
+            The play like function that has to be written to the video file stream. Take the same parameters as `scene.play`, and the animations compiled from them as `compiled_animations`.
         """
 
         def wrapper(self, *args, **kwargs):
             self.revert_to_original_skipping_status()
+            self.update_skipping_status()
+            # Compile the animations once, for both hashing and playing them
             animations = self.compile_play_args_to_animation_list(*args, **kwargs)
             self.add_mobjects_from_animations(animations)
-            if not file_writer_config["disable_caching"]:
+            if file_writer_config["skip_animations"]:
+                # The animation is skipped whether it is cached or not
+                hash_play = "skipped_{:05}".format(self.num_plays)
+                self.play_hashes_list.append(hash_play)
+            elif not file_writer_config["disable_caching"]:
                 mobjects_on_scene = self.get_mobjects()
                 hash_play = get_hash_from_play_call(
                     self.camera, animations, mobjects_on_scene
@@ -811,7 +910,7 @@ class Scene(Container):
             else:
                 hash_play = "uncached_{:05}".format(self.num_plays)
                 self.play_hashes_list.append(hash_play)
-            func(self, *args, **kwargs)
+            func(self, *args, compiled_animations=animations, **kwargs)
 
         return wrapper
 
@@ -829,7 +928,12 @@ class Scene(Container):
 
         def wrapper(self, duration=DEFAULT_WAIT_TIME, stop_condition=None):
             self.revert_to_original_skipping_status()
-            if not file_writer_config["disable_caching"]:
+            self.update_skipping_status()
+            if file_writer_config["skip_animations"]:
+                # The wait is skipped whether it is cached or not
+                hash_wait = "skipped_{:05}".format(self.num_plays)
+                self.play_hashes_list.append(hash_wait)
+            elif not file_writer_config["disable_caching"]:
                 hash_wait = get_hash_from_wait_call(
                     self.camera, duration, stop_condition, self.get_mobjects()
                 )
@@ -868,7 +972,6 @@ class Scene(Container):
         """
 
         def wrapper(self, *args, **kwargs):
-            self.update_skipping_status()
             allow_write = not file_writer_config["skip_animations"]
             self.file_writer.begin_animation(allow_write)
             func(self, *args, **kwargs)
@@ -903,6 +1006,16 @@ class Scene(Container):
         animations : list
             List of involved animations.
         """
+        if file_writer_config["skip_animations"] and file_writer_config["fast_forward"]:
+            # Jump to the end of the animations without computing any frame.
+            # The updaters of the scene are given the whole run time by
+            # finish_animations.
+            run_time = self.get_run_time(animations)
+            for animation in animations:
+                animation.update_mobjects(run_time)
+                animation.interpolate(run_time / animation.run_time)
+            self.skip_frames(self.get_num_frames(run_time))
+            return
         # Paint all non-moving objects onto the screen, so they don't
         # have to be rendered every frame
         moving_mobjects = self.get_moving_mobjects(*animations)
@@ -918,7 +1031,10 @@ class Scene(Container):
                 animation.interpolate(alpha)
             self.update_mobjects(dt)
             self.update_frame(moving_mobjects, static_image)
-            self.add_frames(self.get_frame())
+            self.add_frames(self.get_frame_buffer())
+        if file_writer_config["skip_animations"]:
+            # Only the last frame was computed
+            self.skip_frames(self.get_num_frames(self.get_run_time(animations)) - 1)
 
     def finish_animations(self, animations):
         """
@@ -942,7 +1058,7 @@ class Scene(Container):
 
     @handle_caching_play
     @handle_play_like_call
-    def play(self, *args, **kwargs):
+    def play(self, *args, compiled_animations, **kwargs):
         """
         This method is used to prep the animations for rendering,
         apply the arguments and parameters required to them,
@@ -951,12 +1067,15 @@ class Scene(Container):
         Parameters
         ----------
         *args : Animation or mobject with mobject method and params
+        compiled_animations : list
+            The animations compiled from args and kwargs, passed by
+            handle_caching_play.
         **kwargs : named parameters affecting what was passed in *args e.g run_time, lag_ratio etc.
         """
         if len(args) == 0:
             warnings.warn("Called Scene.play with no animations")
             return
-        animations = self.compile_play_args_to_animation_list(*args, **kwargs)
+        animations = compiled_animations
         self.begin_animations(animations)
         self.progress_through_animations(animations)
         self.finish_animations(animations)
@@ -1052,28 +1171,52 @@ class Scene(Container):
             The scene, after waiting.
         """
         self.update_mobjects(dt=0)  # Any problems with this?
-        if self.should_update_mobjects():
+        fast_forward = (
+            file_writer_config["skip_animations"]
+            and file_writer_config["fast_forward"]
+            and stop_condition is None
+        )
+        if self.should_update_mobjects() and fast_forward:
+            # Jump to the end of the wait without computing any frame
+            self.update_mobjects(duration)
+            self.skip_frames(self.get_num_frames(duration))
+        elif self.should_update_mobjects():
             time_progression = self.get_wait_time_progression(duration, stop_condition)
-            # TODO, be smart about setting a static image
-            # the same way Scene.play does
+            # Paint all non-moving objects onto the screen once, the same
+            # way Scene.play does, and only render the frames in which the
+            # updaters changed something
+            moving_mobjects = self.get_moving_mobjects()
+            self.update_frame(excluded_mobjects=moving_mobjects)
+            static_image = self.get_frame()
+            frame = None
+            last_digest = None
             last_t = 0
             for t in time_progression:
                 dt = t - last_t
                 last_t = t
                 self.update_mobjects(dt)
-                self.update_frame()
-                self.add_frames(self.get_frame())
+                digest = self.get_mobjects_digest(moving_mobjects)
+                if frame is None or digest != last_digest:
+                    self.update_frame(moving_mobjects, static_image)
+                    frame = self.get_frame_buffer()
+                    last_digest = digest
+                self.add_frames(frame)
                 if stop_condition is not None and stop_condition():
                     time_progression.close()
                     break
+            if file_writer_config["skip_animations"] and stop_condition is None:
+                # Only the last frame was computed
+                self.skip_frames(self.get_num_frames(duration) - 1)
         elif file_writer_config["skip_animations"]:
-            # Do nothing
+            # Do nothing, but let the time go by
+            dt = 1 / self.camera.frame_rate
+            self.skip_frames(int(duration / dt))
             return self
         else:
             self.update_frame()
             dt = 1 / self.camera.frame_rate
             n_frames = int(duration / dt)
-            frame = self.get_frame()
+            frame = self.get_frame_buffer()
             self.add_frames(*[frame] * n_frames)
         return self
 
@@ -1,11 +1,12 @@
 import numpy as np
 from pydub import AudioSegment
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import json
 import shutil
 import subprocess
 import os
-import _thread as thread
-from time import sleep
-import datetime
+import zlib
 from PIL import Image
 
 from ..constants import FFMPEG_BIN, GIF_FILE_EXTENSION
@@ -16,6 +17,16 @@ from ..utils.file_ops import guarantee_existence
 from ..utils.file_ops import add_extension_if_not_present
 from ..utils.file_ops import modify_atime
 from ..utils.sounds import get_full_sound_file_path
+from .movie_encoders import FRAGMENTED_MOVFLAGS, get_movie_encoder_class
+from .preview_server import PreviewServer
+
+# The files of the partial movie directory which are not partial movies
+CACHE_BOOKKEEPING_FILES = [
+    "partial_movie_file_list.txt",
+    "partial_movie_file_index.json",
+]
+GIF_PALETTE_PREFIX = "gif_palette_"
+FRAME_IMAGE_EXTENSIONS = {"png": ".png", "tiff": ".tif", "npy": ".npy"}
 
 
 class SceneFileWriter(object):
@@ -33,15 +44,36 @@ class SceneFileWriter(object):
             The PIL image mode to use when outputting PNGs
         "movie_file_extension" (str=".mp4")
             The file-type extension of the outputted video.
+        "persistent_encoder" (bool=False)
+            Whether to encode consecutive rendered animations with a single
+            FFMPEG process instead of one process per animation.
     """
 
     def __init__(self, scene, **kwargs):
         digest_config(self, kwargs)
         self.scene = scene
-        self.stream_lock = False
         self.init_output_directories()
         self.init_audio()
         self.frame_count = 0
+        # With a persistent encoder, the frame ranges of the movie files
+        # making up the scene, in order
+        self.segments = []
+        # The hash, timing and partial movie file of each animation of the
+        # scene, in order
+        self.manifest = []
+        self.preview_server = None
+        if file_writer_config["live_preview"]:
+            try:
+                self.preview_server = PreviewServer(
+                    self.scene.camera.get_pixel_width(),
+                    self.scene.camera.get_pixel_height(),
+                    self.scene.camera.frame_rate,
+                    port=file_writer_config["live_preview_port"],
+                    scale=file_writer_config["live_preview_scale"],
+                    frame_pool=self.scene.frame_pool,
+                )
+            except OSError as error:
+                logger.warning(f"The live preview could not be started: {error}")
 
     # Output directories and files
     def init_output_directories(self):
@@ -195,6 +227,31 @@ class SceneFileWriter(object):
         )
         return result
 
+    def get_partial_movie_file_index_path(self):
+        return os.path.join(
+            self.partial_movie_directory, "partial_movie_file_index.json"
+        )
+
+    def load_partial_movie_file_index(self):
+        """
+        Reads the index of the movie files written by persistent encoders.
+
+        The index maps the hash of every animation they contain to its file
+        and frame range, and every file to its number of frames.
+
+        Returns
+        -------
+        dict
+            The index, with "animations" and "files" entries.
+        """
+        if not hasattr(self, "partial_movie_file_index"):
+            try:
+                with open(self.get_partial_movie_file_index_path()) as fp:
+                    self.partial_movie_file_index = json.load(fp)
+            except (OSError, ValueError):
+                self.partial_movie_file_index = {"animations": {}, "files": {}}
+        return self.partial_movie_file_index
+
     def get_movie_file_path(self):
         """
         Returns the final path of the written video file.
@@ -212,12 +269,11 @@ class SceneFileWriter(object):
         Preps the writer for adding audio to the movie.
         """
         self.includes_sound = False
-
-    def create_audio_segment(self):
-        """
-        Creates an empty, silent, Audio Segment.
-        """
-        self.audio_segment = AudioSegment.silent()
+        # The sounds are only mixed once the scene is finished, as
+        # (segment, time, gain, gain_to_background) events
+        self.audio_events = []
+        self.audio_duration = 0
+        self.sound_file_segments = {}
 
     def add_audio_segment(self, new_segment, time=None, gain_to_background=None):
         """
@@ -236,27 +292,21 @@ class SceneFileWriter(object):
         gain_to_background : optional
             The gain of the segment from the background.
         """
-        if not self.includes_sound:
-            self.includes_sound = True
-            self.create_audio_segment()
-        segment = self.audio_segment
-        curr_end = segment.duration_seconds
+        self.add_audio_event(new_segment, time, gain_to_background=gain_to_background)
+
+    def add_audio_event(self, segment, time=None, gain=None, gain_to_background=None):
+        """
+        Records that an audio segment plays at some time, with some gain.
+        The same segment can be added any number of times, it is
+        decoded once when the audio is mixed.
+        """
+        self.includes_sound = True
         if time is None:
-            time = curr_end
+            time = self.audio_duration
         if time < 0:
             raise Exception("Adding sound at timestamp < 0")
-
-        new_end = time + new_segment.duration_seconds
-        diff = new_end - curr_end
-        if diff > 0:
-            segment = segment.append(
-                AudioSegment.silent(int(np.ceil(diff * 1000))), crossfade=0,
-            )
-        self.audio_segment = segment.overlay(
-            new_segment,
-            position=int(1000 * time),
-            gain_during_overlay=gain_to_background,
-        )
+        self.audio_events.append((segment, time, gain, gain_to_background))
+        self.audio_duration = max(self.audio_duration, time + segment.duration_seconds)
 
     def add_sound(self, sound_file, time=None, gain=None, **kwargs):
         """
@@ -279,10 +329,56 @@ class SceneFileWriter(object):
 
         """
         file_path = get_full_sound_file_path(sound_file)
-        new_segment = AudioSegment.from_file(file_path)
-        if gain:
-            new_segment = new_segment.apply_gain(gain)
-        self.add_audio_segment(new_segment, time, **kwargs)
+        if file_path not in self.sound_file_segments:
+            self.sound_file_segments[file_path] = AudioSegment.from_file(file_path)
+        self.add_audio_event(self.sound_file_segments[file_path], time, gain, **kwargs)
+
+    def get_audio_samples(self, segment, frame_rate, channels):
+        """
+        Decodes an audio segment into an array of float samples
+        between -1 and 1, of shape (n_samples, channels).
+        """
+        segment = segment.set_frame_rate(frame_rate).set_channels(channels)
+        segment = segment.set_sample_width(2)
+        samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
+        return samples.reshape(-1, channels) / 2 ** 15
+
+    def mix_audio(self):
+        """
+        Mixes all the added sounds in a single pass.
+
+        Returns
+        -------
+        tuple
+            The 16 bit samples of the mix, of shape (n_samples, channels),
+            and their frame rate.
+        """
+        segments = [event[0] for event in self.audio_events]
+        frame_rate = max(segment.frame_rate for segment in segments)
+        channels = max(segment.channels for segment in segments)
+        # Sounds are timed from the start of the movie
+        start_time = self.get_movie_start_time()
+        n_samples = int(np.ceil((self.audio_duration - start_time) * frame_rate))
+        mix = np.zeros((n_samples, channels), dtype=np.float32)
+        decoded_samples = {}
+        for segment, time, gain, gain_to_background in self.audio_events:
+            if id(segment) not in decoded_samples:
+                decoded_samples[id(segment)] = self.get_audio_samples(
+                    segment, frame_rate, channels
+                )
+            samples = decoded_samples[id(segment)]
+            start = int(round((time - start_time) * frame_rate))
+            if start < 0:
+                samples = samples[-start:]
+                start = 0
+            end = min(start + len(samples), n_samples)
+            if gain_to_background is not None:
+                mix[start:end] *= 10 ** (gain_to_background / 20)
+            if gain:
+                samples = samples * 10 ** (gain / 20)
+            mix[start:end] += samples[: end - start]
+        mix = np.clip(np.round(mix * 2 ** 15), -(2 ** 15), 2 ** 15 - 1)
+        return mix.astype(np.int16), frame_rate
 
     # Writers
     def begin_animation(self, allow_write=False):
@@ -295,8 +391,40 @@ class SceneFileWriter(object):
         allow_write : bool, optional
             Whether or not to write to a video file.
         """
-        if file_writer_config["write_to_movie"] and allow_write:
-            self.open_movie_pipe()
+        # Number the saved frames by their position in the scene, so they
+        # don't depend on which animations were cached
+        self.frame_count = int(round(self.scene.time * self.scene.camera.frame_rate))
+        if not file_writer_config["write_to_movie"]:
+            return
+        hash_play = self.scene.play_hashes_list[self.scene.num_plays]
+        # The animation is part of the movie if it is rendered, or cached
+        # and among the animations selected with -n
+        in_movie = allow_write or (
+            not file_writer_config["disable_caching"]
+            and self.scene.num_plays >= file_writer_config["from_animation_number"]
+            and self.is_already_cached(hash_play)
+        )
+        self.manifest_entry = {
+            "hash": hash_play,
+            "start_time": self.scene.time,
+            "in_movie": in_movie,
+        }
+        if not self.persistent_encoder:
+            if allow_write:
+                self.open_movie_pipe()
+            return
+        if allow_write:
+            if not hasattr(self, "movie_encoder"):
+                self.open_movie_pipe()
+            self.animation_start_frame = self.run_frame_count
+        else:
+            # Cached animations are spliced in between, so the frames
+            # rendered after them go to a new file
+            self.close_movie_pipe()
+            if in_movie:
+                self.segments.append(
+                    self.load_partial_movie_file_index()["animations"][hash_play]
+                )
 
     def end_animation(self, allow_write=False):
         """
@@ -308,9 +436,47 @@ class SceneFileWriter(object):
         allow_write : bool, optional
             Whether or not to write to a video file.
         """
-        if file_writer_config["write_to_movie"] and allow_write:
+        if not file_writer_config["write_to_movie"]:
+            return
+        if self.persistent_encoder and allow_write:
+            segment = [
+                os.path.basename(self.partial_movie_file_path),
+                self.animation_start_frame,
+                self.run_frame_count,
+            ]
+            self.run_animations[self.manifest_entry["hash"]] = segment
+            self.segments.append(segment)
+        self.add_manifest_entry()
+        if allow_write and not self.persistent_encoder:
             self.close_movie_pipe()
 
+    def add_manifest_entry(self):
+        """
+        Completes the manifest entry of the animation that just ended
+        with its number of frames and the file they are in.
+        """
+        entry = self.manifest_entry
+        duration = self.scene.time - entry["start_time"]
+        entry["n_frames"] = int(round(duration * self.scene.camera.frame_rate))
+        if not entry["in_movie"]:
+            entry["file"], entry["first_frame"] = None, None
+        elif self.persistent_encoder:
+            entry["file"], entry["first_frame"], _ = self.segments[-1]
+        else:
+            entry["file"] = entry["hash"] + file_writer_config["movie_file_extension"]
+            entry["first_frame"] = 0
+        self.manifest.append(entry)
+
+    def get_movie_start_time(self):
+        """
+        Returns the time in the scene at which the movie starts, which
+        is not 0 when rendering from an animation number with -n.
+        """
+        for entry in self.manifest:
+            if entry["in_movie"]:
+                return entry["start_time"]
+        return 0
+
     def write_frame(self, frame):
         """
         Used internally by Manim to write a frame to
@@ -319,14 +485,75 @@ class SceneFileWriter(object):
         Parameters
         ----------
         frame : np.array
-            Pixel array of the frame.
+            Pixel array of the frame.  It is written by reference: what
+            keeps it once this returns holds it in the frame pool of the
+            scene.
         """
         if file_writer_config["write_to_movie"]:
-            self.writing_process.stdin.write(frame.tostring())
+            self.movie_encoder.write_frame(frame)
+            if self.persistent_encoder:
+                self.run_frame_count += 1
         if file_writer_config["save_pngs"]:
-            path, extension = os.path.splitext(self.image_file_path)
-            Image.fromarray(frame).save(f"{path}{self.frame_count}{extension}")
-            self.frame_count += 1
+            self.save_frame_image(frame)
+        if self.preview_server is not None:
+            self.preview_server.send_frame(frame)
+
+    def save_frame_image(self, frame):
+        """
+        Saves a frame as the image of the sequence numbered
+        frame_count, in the format set by frame_image_format.
+        The images are encoded by a pool of threads while the
+        next frames are rendered.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame.  It must not be modified
+            afterwards, which the frame pool of the scene ensures
+            for its buffers until the image is saved.
+        """
+        if not hasattr(self, "frame_image_pool"):
+            n_threads = file_writer_config["frame_writer_threads"]
+            self.frame_image_pool = ThreadPoolExecutor(n_threads)
+            self.frame_image_futures = deque()
+            self.max_pending_frame_images = 2 * n_threads
+        # Bound the number of frames held in memory
+        while len(self.frame_image_futures) >= self.max_pending_frame_images:
+            self.frame_image_futures.popleft().result()
+        path, _ = os.path.splitext(self.image_file_path)
+        extension = FRAME_IMAGE_EXTENSIONS[file_writer_config["frame_image_format"]]
+        file_path = f"{path}{self.frame_count}{extension}"
+        frame_pool = self.scene.frame_pool
+        frame_pool.hold(frame)
+        future = self.frame_image_pool.submit(self.write_frame_image, frame, file_path)
+        future.add_done_callback(lambda _: frame_pool.release(frame))
+        self.frame_image_futures.append(future)
+        self.frame_count += 1
+
+    def write_frame_image(self, frame, file_path):
+        image_format = file_writer_config["frame_image_format"]
+        if image_format == "npy":
+            # Raw arrays, which can be read back with np.load(mmap_mode="r")
+            np.save(file_path, frame)
+        elif image_format == "tiff":
+            # Uncompressed
+            Image.fromarray(frame).save(file_path)
+        else:
+            Image.fromarray(frame).save(
+                file_path, compress_level=file_writer_config["png_compression_level"]
+            )
+
+    def finish_frame_images(self):
+        """
+        Waits for the frames being saved as images, and raises
+        any error that happened while saving them.
+        """
+        if not hasattr(self, "frame_image_pool"):
+            return
+        while self.frame_image_futures:
+            self.frame_image_futures.popleft().result()
+        self.frame_image_pool.shutdown()
+        del self.frame_image_pool
 
     def save_final_image(self, image):
         """
@@ -342,22 +569,6 @@ class SceneFileWriter(object):
         image.save(file_path)
         self.print_file_ready_message(file_path)
 
-    def idle_stream(self):
-        """
-        Doesn't write anything to the FFMPEG frame buffer.
-        """
-        while self.stream_lock:
-            a = datetime.datetime.now()
-            self.update_frame()
-            n_frames = 1
-            frame = self.get_frame()
-            self.add_frames(*[frame] * n_frames)
-            b = datetime.datetime.now()
-            time_diff = (b - a).total_seconds()
-            frame_duration = 1 / self.scene.camera.frame_rate
-            if time_diff < frame_duration:
-                sleep(frame_duration - time_diff)
-
     def finish(self):
         """
         Finishes writing to the FFMPEG buffer.
@@ -366,9 +577,15 @@ class SceneFileWriter(object):
         If save_last_frame is True, saves the last
         frame in the default image directory.
         """
+        self.finish_frame_images()
+        if self.preview_server is not None:
+            self.preview_server.close()
+            self.preview_server = None
         if file_writer_config["write_to_movie"]:
-            if hasattr(self, "writing_process"):
-                self.writing_process.terminate()
+            if self.persistent_encoder:
+                self.close_movie_pipe()
+            elif hasattr(self, "movie_encoder"):
+                self.movie_encoder.terminate()
             self.combine_movie_files()
             if file_writer_config["flush_cache"]:
                 self.flush_cache_directory()
@@ -380,11 +597,18 @@ class SceneFileWriter(object):
 
     def open_movie_pipe(self):
         """
-        Used internally by Manim to initalise
-        FFMPEG and begin writing to FFMPEG's input
-        buffer.
+        Used internally by Manim to initalise the
+        encoder of the next partial movie file, with the
+        backend and settings of file_writer_config.
         """
         file_path = self.get_next_partial_movie_path()
+        if self.persistent_encoder:
+            # The file holds all the animations rendered from this one on,
+            # so don't mistake it for the single animation file of its hash
+            root, extension = os.path.splitext(file_path)
+            file_path = root + "_run" + extension
+            self.run_frame_count = 0
+            self.run_animations = {}
         temp_file_path = (
             os.path.splitext(file_path)[0]
             + "_temp"
@@ -393,45 +617,28 @@ class SceneFileWriter(object):
         self.partial_movie_file_path = file_path
         self.temp_partial_movie_file_path = temp_file_path
 
-        fps = self.scene.camera.frame_rate
-        height = self.scene.camera.get_pixel_height()
-        width = self.scene.camera.get_pixel_width()
-
-        command = [
-            FFMPEG_BIN,
-            "-y",  # overwrite output file if it exists
-            "-f",
-            "rawvideo",
-            "-s",
-            "%dx%d" % (width, height),  # size of one frame
-            "-pix_fmt",
-            "rgba",
-            "-r",
-            str(fps),  # frames per second
-            "-i",
-            "-",  # The imput comes from a pipe
-            "-an",  # Tells FFMPEG not to expect any audio
-            "-loglevel",
-            file_writer_config["ffmpeg_loglevel"],
-        ]
         # TODO, the test for a transparent background should not be based on
         # the file extension.
-        if file_writer_config["movie_file_extension"] == ".mov":
-            # This is if the background of the exported
-            # video should be transparent.
-            command += [
-                "-vcodec",
-                "qtrle",
-            ]
-        else:
-            command += [
-                "-vcodec",
-                "libx264",
-                "-pix_fmt",
-                "yuv420p",
-            ]
-        command += [temp_file_path]
-        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        transparent = file_writer_config["movie_file_extension"] == ".mov"
+        max_b_frames = None
+        if self.persistent_encoder and not transparent:
+            # Without B-frames packets are stored in display order, so
+            # cutting the file after any animation by stream copy is
+            # frame exact
+            max_b_frames = 0
+        encoder_class = get_movie_encoder_class(file_writer_config["encoder_backend"])
+        self.movie_encoder = encoder_class(
+            temp_file_path,
+            self.scene.camera.get_pixel_width(),
+            self.scene.camera.get_pixel_height(),
+            self.scene.camera.frame_rate,
+            transparent=transparent,
+            max_b_frames=max_b_frames,
+            loglevel=file_writer_config["ffmpeg_loglevel"],
+            fragmented=file_writer_config["fragmented_mp4"],
+            frame_pool=self.scene.frame_pool,
+            **file_writer_config["encoder_options"],
+        )
 
     def close_movie_pipe(self):
         """
@@ -439,15 +646,37 @@ class SceneFileWriter(object):
         input buffer, and move the temporary files into their permananant
         locations
         """
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
+        if not hasattr(self, "movie_encoder"):
+            return
+        self.movie_encoder.close()
+        del self.movie_encoder
         shutil.move(
             self.temp_partial_movie_file_path, self.partial_movie_file_path,
         )
+        if self.persistent_encoder:
+            self.update_partial_movie_file_index()
         logger.debug(
             f"Animation {self.scene.num_plays} : Partial movie file written in {self.partial_movie_file_path}"
         )
 
+    def update_partial_movie_file_index(self):
+        """
+        Records the frame ranges of the animations in the file just written
+        by the persistent encoder, so they can be reused by later renders.
+        """
+        index = self.load_partial_movie_file_index()
+        file_name = os.path.basename(self.partial_movie_file_path)
+        # The file may have been overwritten, so forget what it held before
+        index["animations"] = {
+            hash_play: segment
+            for hash_play, segment in index["animations"].items()
+            if segment[0] != file_name
+        }
+        index["animations"].update(self.run_animations)
+        index["files"][file_name] = self.run_frame_count
+        with open(self.get_partial_movie_file_index_path(), "w") as fp:
+            json.dump(index, fp)
+
     def is_already_cached(self, hash_invocation):
         """Will check if a file named with `hash_invocation` exists.
 
@@ -461,12 +690,64 @@ class SceneFileWriter(object):
         :class:`bool`
             Whether the file exists.
         """
+        if self.persistent_encoder:
+            return self.is_already_cached_in_index(hash_invocation)
         path = os.path.join(
             self.partial_movie_directory,
             "{}{}".format(hash_invocation, self.movie_file_extension),
         )
         return os.path.exists(path)
 
+    def is_already_cached_in_index(self, hash_invocation):
+        """Will check if the animation of hash `hash_invocation` can be spliced
+        in from a file written by a persistent encoder.
+
+        Files are only ever cut after an animation, so the animation has to
+        start its file or directly follow the previous animation of the scene
+        in it.
+
+        Parameters
+        ----------
+        hash_invocation : :class:`str`
+            The hash corresponding to an invocation to either `scene.play` or `scene.wait`.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the animation can be reused.
+        """
+        index = self.load_partial_movie_file_index()
+        segment = index["animations"].get(hash_invocation)
+        if segment is None:
+            return False
+        file_name, start, _ = segment
+        if not os.path.exists(os.path.join(self.partial_movie_directory, file_name)):
+            return False
+        if start == 0:
+            return True
+        return len(self.segments) > 0 and self.segments[-1][0::2] == [
+            file_name,
+            start,
+        ]
+
+    def get_partial_movie_file_segments(self):
+        """
+        Merges the frame ranges used from the files written by persistent
+        encoders, so that consecutive animations of a file are read at once.
+
+        Returns
+        -------
+        list
+            The file name and frame range of each part of the scene.
+        """
+        merged = []
+        for file_name, start, end in self.segments:
+            if merged and merged[-1][0] == file_name and merged[-1][2] == start:
+                merged[-1][2] = end
+            else:
+                merged.append([file_name, start, end])
+        return merged
+
     def combine_movie_files(self):
         """
         Used internally by Manim to combine the separate
@@ -480,13 +761,18 @@ class SceneFileWriter(object):
         # cuts at all the places you might want.  But for viewing
         # the scene as a whole, one of course wants to see it as a
         # single piece.
-        partial_movie_files = [
-            os.path.join(
-                self.partial_movie_directory,
-                "{}{}".format(hash_play, file_writer_config["movie_file_extension"]),
-            )
-            for hash_play in self.scene.play_hashes_list
-        ]
+        if self.persistent_encoder:
+            segments = self.get_partial_movie_file_segments()
+            partial_movie_files = [
+                os.path.join(self.partial_movie_directory, file_name)
+                for file_name, _, _ in segments
+            ]
+        else:
+            partial_movie_files = [
+                os.path.join(self.partial_movie_directory, entry["file"])
+                for entry in self.manifest
+                if entry["in_movie"]
+            ]
         if len(partial_movie_files) == 0:
             logger.error("No animations in this scene")
             return
@@ -497,88 +783,150 @@ class SceneFileWriter(object):
         )
         with open(file_list, "w") as fp:
             fp.write("# This file is used internally by FFMPEG.\n")
-            for pf_path in partial_movie_files:
+            for i, pf_path in enumerate(partial_movie_files):
                 if os.name == "nt":
                     pf_path = pf_path.replace("\\", "/")
                 fp.write("file 'file:{}'\n".format(pf_path))
-        movie_file_path = self.get_movie_file_path()
-        commands = [
-            FFMPEG_BIN,
-            "-y",  # overwrite output file if it exists
-            "-f",
-            "concat",
-            "-safe",
-            "0",
-            "-i",
-            file_list,
-            "-loglevel",
-            file_writer_config["ffmpeg_loglevel"],
-        ]
-
-        if self.write_to_movie and not self.save_as_gif:
-            commands += ["-c", "copy", movie_file_path]
-
+                if self.persistent_encoder:
+                    # Segments always start their file, but may stop before
+                    # its end.  Cut between the last frame kept and the next
+                    # one to be safe from rounding.
+                    file_name, _, end = segments[i]
+                    index = self.load_partial_movie_file_index()
+                    if end < index["files"][file_name]:
+                        frame_rate = self.scene.camera.frame_rate
+                        fp.write("outpoint {}\n".format((end - 0.5) / frame_rate))
         if self.save_as_gif:
-            commands += [self.gif_file_path]
+            self.write_gif(file_list)
+        else:
+            self.write_movie(file_list)
+        self.print_file_ready_message(
+            self.gif_file_path if self.save_as_gif else self.get_movie_file_path()
+        )
+        if file_writer_config["write_to_movie"]:
+            for file_path in partial_movie_files:
+                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
+                modify_atime(file_path)
 
-        if not self.includes_sound:
-            commands.insert(-1, "-an")
+    def get_concat_input(self, file_list):
+        """
+        Returns the FFMPEG arguments reading the partial movie files
+        listed in `file_list` as a single input.
+        """
+        return ["-f", "concat", "-safe", "0", "-i", file_list]
 
-        combine_process = subprocess.Popen(commands)
-        combine_process.wait()
+    def write_movie(self, file_list):
+        """
+        Writes the movie file of the scene in a single FFMPEG invocation,
+        copying the video of the partial movie files listed in `file_list`
+        and encoding the mixed sounds, which are piped to FFMPEG, if any.
 
+        Parameters
+        ----------
+        file_list : :class:`str`
+            The path of the concat list of the partial movie files.
+        """
+        commands = [
+            FFMPEG_BIN,
+            "-y",  # overwrite output file if it exists
+            *self.get_concat_input(file_list),
+        ]
+        samples = None
         if self.includes_sound:
-            sound_file_path = movie_file_path.replace(
-                file_writer_config["movie_file_extension"], ".wav"
-            )
-            # Makes sure sound file length will match video file
-            self.add_audio_segment(AudioSegment.silent(0))
-            self.audio_segment.export(
-                sound_file_path, bitrate="312k",
-            )
-            temp_file_path = movie_file_path.replace(".", "_temp.")
-            commands = [
-                FFMPEG_BIN,
-                "-i",
-                movie_file_path,
+            samples, frame_rate = self.mix_audio()
+            commands += [
+                "-f",
+                "s16le",
+                "-ar",
+                str(frame_rate),
+                "-ac",
+                str(samples.shape[1]),
                 "-i",
-                sound_file_path,
-                "-y",  # overwrite output file if it exists
-                "-c:v",
-                "copy",
-                "-c:a",
-                "aac",
-                "-b:a",
-                "320k",
-                # select video stream from first file
+                "-",  # The sound comes from a pipe
+                # select video stream from first input
                 "-map",
                 "0:v:0",
-                # select audio stream from second file
+                # select audio stream from second input
                 "-map",
                 "1:a:0",
-                "-loglevel",
-                file_writer_config["ffmpeg_loglevel"],
-                # "-shortest",
-                temp_file_path,
+                "-c:a",
+                "aac",
+                "-b:a",
+                "320k",
             ]
-            subprocess.call(commands)
-            shutil.move(temp_file_path, movie_file_path)
-            os.remove(sound_file_path)
+        else:
+            commands += ["-an"]
+        commands += ["-c:v", "copy"]
+        if file_writer_config["fragmented_mp4"]:
+            commands += ["-movflags", FRAGMENTED_MOVFLAGS]
+        commands += [
+            "-loglevel",
+            file_writer_config["ffmpeg_loglevel"],
+            self.get_movie_file_path(),
+        ]
+        if samples is None:
+            subprocess.Popen(commands).wait()
+        else:
+            combine_process = subprocess.Popen(commands, stdin=subprocess.PIPE)
+            combine_process.communicate(samples.tobytes())
 
-        self.print_file_ready_message(
-            self.gif_file_path if self.save_as_gif else movie_file_path
+    def write_gif(self, file_list):
+        """
+        Writes the GIF of the scene with a palette computed from its frames.
+
+        The palette is generated by a first pass over the partial movie
+        files and kept with them, named after the content of `file_list`,
+        so that rendering the same animations again only takes the second
+        pass.
+
+        Parameters
+        ----------
+        file_list : :class:`str`
+            The path of the concat list of the partial movie files.
+        """
+        with open(file_list, "rb") as fp:
+            palette_hash = zlib.crc32(fp.read())
+        palette_file_path = os.path.join(
+            self.partial_movie_directory, f"{GIF_PALETTE_PREFIX}{palette_hash}.png"
         )
-        if file_writer_config["write_to_movie"]:
-            for file_path in partial_movie_files:
-                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
-                modify_atime(file_path)
+        loglevel = ["-loglevel", file_writer_config["ffmpeg_loglevel"]]
+        if not os.path.exists(palette_file_path):
+            # Only the palette of the latest animations is worth keeping
+            for file_name in os.listdir(self.partial_movie_directory):
+                if file_name.startswith(GIF_PALETTE_PREFIX):
+                    os.remove(os.path.join(self.partial_movie_directory, file_name))
+            commands = [
+                FFMPEG_BIN,
+                "-y",  # overwrite output file if it exists
+                *self.get_concat_input(file_list),
+                # Weigh the colors of what moves, rather than the background
+                "-vf",
+                "palettegen=stats_mode=diff",
+                *loglevel,
+                palette_file_path,
+            ]
+            subprocess.Popen(commands).wait()
+        commands = [
+            FFMPEG_BIN,
+            "-y",  # overwrite output file if it exists
+            *self.get_concat_input(file_list),
+            "-i",
+            palette_file_path,
+            # Only dither the parts of the frames that changed
+            "-lavfi",
+            "paletteuse=dither=bayer:bayer_scale=5:diff_mode=rectangle",
+            *loglevel,
+            self.gif_file_path,
+        ]
+        subprocess.Popen(commands).wait()
 
     def clean_cache(self):
         """Will clean the cache by removing the partial_movie_files used by manim the longest ago."""
         cached_partial_movies = [
             os.path.join(self.partial_movie_directory, file_name)
             for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
+            if file_name not in CACHE_BOOKKEEPING_FILES
+            and not file_name.startswith(GIF_PALETTE_PREFIX)
         ]
         if len(cached_partial_movies) > file_writer_config["max_files_cached"]:
             number_files_to_delete = (
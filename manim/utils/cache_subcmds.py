@@ -0,0 +1,63 @@
+"""
+cache_subcmds.py
+----------------
+
+Utilities to inspect and shrink the cache of compiled TeX expressions.
+The functions below can be called via the `manim cache` subcommand.
+
+"""
+import os
+
+from rich.console import Console
+
+from ..config import file_writer_config
+from .tex_cache import TexCache
+
+__all__ = ["stats", "prune"]
+
+console = Console()
+
+
+def _format_size(size):
+    """Formats a size in bytes as megabytes for display."""
+    if size == float("inf"):
+        return "unlimited"
+    return f"{size / 1024 ** 2:.2f} MB"
+
+
+def _get_tex_cache():
+    tex_dir = file_writer_config["tex_dir"]
+    if not os.path.isdir(tex_dir):
+        console.print(f"No TeX cache found at {tex_dir}.", style="red bold")
+        return None
+    max_size = file_writer_config["max_tex_cache_size"] * 1024 ** 2
+    return TexCache(tex_dir, max_size)
+
+
+def stats():
+    tex_cache = _get_tex_cache()
+    if tex_cache is None:
+        return
+    tex_cache.synchronize()
+    cache_stats = tex_cache.get_stats()
+    tex_cache.close()
+    console.print(f"TeX cache : {os.path.abspath(tex_cache.directory)}")
+    console.print(f"expressions : {cache_stats['entries']}")
+    console.print(f"size : {_format_size(cache_stats['size'])}")
+    console.print(f"max size : {_format_size(cache_stats['max_size'])}")
+
+
+def prune(max_size=None):
+    """Shrinks the TeX cache to `max_size` megabytes, or to the configured limit."""
+    tex_cache = _get_tex_cache()
+    if tex_cache is None:
+        return
+    if max_size is not None:
+        max_size = max_size * 1024 ** 2
+    evicted = tex_cache.prune(max_size)
+    cache_stats = tex_cache.get_stats()
+    tex_cache.close()
+    console.print(
+        f"Removed {evicted} expressions from the TeX cache, "
+        f"{cache_stats['entries']} left ({_format_size(cache_stats['size'])})."
+    )
@@ -104,3 +104,15 @@ def get_shaded_rgb(rgb, point, unit_normal_vect, light_source):
     result = rgb + factor
     clip_in_place(rgb + factor, 0, 1)
     return result
+
+
+def get_shading_factors(points, unit_normals, light_source):
+    """Vectorized version of the amount get_shaded_rgb adds to a color, for
+    arrays of points and their unit normals."""
+    to_sun = light_source - points
+    norms = np.linalg.norm(to_sun, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    to_sun /= norms
+    factors = 0.5 * (unit_normals * to_sun).sum(-1) ** 3
+    factors[factors < 0] *= 0.5
+    return factors
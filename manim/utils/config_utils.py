@@ -60,13 +60,14 @@ def _parse_file_writer_config(config_parser, args):
         "disable_caching",
         "flush_cache",
         "log_to_file",
+        "live_preview",
     ]:
 
         attr = getattr(args, boolean_opt)
         fw_config[boolean_opt] = (
             default.getboolean(boolean_opt) if attr is None else attr
         )
-    # for str_opt in ['media_dir', 'video_dir', 'tex_dir', 'text_dir']:
+    # for str_opt in ['media_dir', 'video_dir', 'tex_dir']:
     for str_opt in ["media_dir", "log_dir"]:
         attr = getattr(args, str_opt)
         fw_config[str_opt] = os.path.relpath(default[str_opt]) if attr is None else attr
@@ -74,7 +75,6 @@ def _parse_file_writer_config(config_parser, args):
         "video_dir": "videos",
         "images_dir": "images",
         "tex_dir": "Tex",
-        "text_dir": "texts",
     }
     for name in dir_names:
         fw_config[name] = os.path.join(fw_config["media_dir"], dir_names[name])
@@ -84,7 +84,7 @@ def _parse_file_writer_config(config_parser, args):
     fw_config["custom_folders"] = args.custom_folders
     if fw_config["custom_folders"]:
         fw_config["media_dir"] = config_parser["custom_folders"].get("media_dir")
-        for opt in ["video_dir", "images_dir", "tex_dir", "text_dir"]:
+        for opt in ["video_dir", "images_dir", "tex_dir"]:
             fw_config[opt] = config_parser["custom_folders"].get(opt)
 
     # Handle the -s (--save_last_frame) flag: invalidate the -w flag
@@ -151,6 +151,16 @@ def _parse_file_writer_config(config_parser, args):
     fw_config["max_files_cached"] = default.getint("max_files_cached")
     if fw_config["max_files_cached"] == -1:
         fw_config["max_files_cached"] = float("inf")
+    fw_config["max_tex_cache_size"] = default.getint("max_tex_cache_size")
+    if fw_config["max_tex_cache_size"] == -1:
+        fw_config["max_tex_cache_size"] = float("inf")
+    fw_config["preload_tex_format"] = default.getboolean("preload_tex_format")
+    fw_config["fast_forward"] = default.getboolean("fast_forward")
+    fw_config["persistent_encoder"] = default.getboolean("persistent_encoder")
+    fw_config["frame_image_format"] = default["frame_image_format"]
+    for opt in ["png_compression_level", "frame_writer_threads", "live_preview_port"]:
+        fw_config[opt] = default.getint(opt)
+    fw_config["live_preview_scale"] = default.getfloat("live_preview_scale")
     # Parse the verbosity flag to read in the log level
     verbosity = getattr(args, "verbosity")
     verbosity = default["verbosity"] if verbosity is None else verbosity
@@ -164,6 +174,16 @@ def _parse_file_writer_config(config_parser, args):
         else ffmpeg_loglevel
     )
 
+    # Parse the encoder settings.  Empty ones are left to the codec.
+    fw_config["encoder_backend"] = config_parser["ffmpeg"].get("encoder", "subprocess")
+    fw_config["encoder_options"] = {}
+    for opt in ["codec", "preset", "crf", "gop_size", "threads"]:
+        value = config_parser["ffmpeg"].get(opt, "")
+        fw_config["encoder_options"][opt] = value if value else None
+    fw_config["fragmented_mp4"] = config_parser["ffmpeg"].getboolean(
+        "fragmented_mp4", False
+    )
+
     # Parse the progress_bar flag
     progress_bar = getattr(args, "progress_bar")
     if progress_bar is None:
@@ -191,6 +211,8 @@ def _parse_cli(arg_list, input=True):
             # subcommand's subparser.
             if only_manim or _subcommand_name() in ["cfg", "--help", "-h"]:
                 cfg_related = _init_cfg_subcmd(subparsers)
+            if only_manim or _subcommand_name() in ["cache", "--help", "-h"]:
+                cache_related = _init_cache_subcmd(subparsers)
 
         if only_manim or not _subcommand_name(ignore=["--help", "-h"]):
             parser.add_argument(
@@ -294,6 +316,12 @@ def _parse_cli(arg_list, input=True):
         const=True,
         help="Log terminal output to file",
     )
+    parser.add_argument(
+        "--live_preview",
+        action="store_const",
+        const=True,
+        help="Stream the frames being rendered on localhost",
+    )
     # The default value of the following is set in manim.cfg
     parser.add_argument(
         "-c", "--background_color", help="Specify background color",
@@ -348,6 +376,13 @@ def _parse_cli(arg_list, input=True):
         "-k", "--fourk_quality", action="store_true", help="Render at 4K quality",
     )
 
+    parser.add_argument(
+        "--draft",
+        action="store_const",
+        const=True,
+        help="Render a quick, lower fidelity draft of the scene",
+    )
+
     # This overrides any of the above
     parser.add_argument(
         "-r",
@@ -411,6 +446,10 @@ def _parse_cli(arg_list, input=True):
                 "cfg_subcommand",
                 cfg_related.parse_args(sys.argv[2:]).cfg_subcommand,
             )
+        elif _subcommand_name() == "cache":
+            cache_args = cache_related.parse_args(sys.argv[2:])
+            setattr(parsed, "cache_subcommand", cache_args.cache_subcommand)
+            setattr(parsed, "max_size", getattr(cache_args, "max_size", None))
 
     return parsed
 
@@ -421,7 +460,6 @@ def _init_dirs(config):
         config["media_dir"],
         config["video_dir"],
         config["tex_dir"],
-        config["text_dir"],
         config["log_dir"],
     ]:
         if not os.path.exists(folder):
@@ -530,7 +568,7 @@ def _subcommand_name(ignore=()):
         If a subcommand is found, returns the string of its name. Returns None if no
         subcommand is found.
     """
-    NON_ANIM_UTILS = ["cfg", "--help", "-h"]
+    NON_ANIM_UTILS = ["cfg", "cache", "--help", "-h"]
     NON_ANIM_UTILS = [util for util in NON_ANIM_UTILS if util not in ignore]
 
     # If a subcommand is found, break out of the inner loop, and hit the break of the outer loop
@@ -584,3 +622,33 @@ def _init_cfg_subcmd(subparsers):
     cfg_export_parser.add_argument("--dir", default=os.getcwd())
 
     return cfg_related
+
+
+def _init_cache_subcmd(subparsers):
+    """Initialises the subparser for the `cache` subcommand.
+
+    Parameters
+    ----------
+    subparsers : :class:`argparse._SubParsersAction`
+        The subparser object for which to add the sub-subparser for the cache subcommand.
+
+    Returns
+    -------
+    :class:`argparse.ArgumentParser`
+        The parser that parser anything cache subcommand related.
+    """
+    cache_related = subparsers.add_parser("cache",)
+    cache_subparsers = cache_related.add_subparsers(dest="cache_subcommand")
+
+    cache_subparsers.add_parser("stats")
+
+    cache_prune_parser = cache_subparsers.add_parser("prune")
+    cache_prune_parser.add_argument(
+        "--max_size",
+        type=float,
+        default=None,
+        help="Size in megabytes to shrink the TeX cache to. "
+        "Defaults to max_tex_cache_size from the config.",
+    )
+
+    return cache_related
@@ -25,6 +25,18 @@ class TexTemplateFromFile:
         with open(self.filename, "r") as infile:
             self.body = infile.read()
 
+    def get_preamble(self):
+        """Returns the part of the template before `\\begin{document}`.
+
+        This is what a precompiled format of the template contains.
+
+        Returns
+        -------
+        :class:`str`
+            The preamble of the template.
+        """
+        return self.body.split(r"\begin{document}")[0]
+
     def get_text_for_text_mode(self, expression):
         """Inserting expression verbatim into TeX template.
 
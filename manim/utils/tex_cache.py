@@ -0,0 +1,196 @@
+"""
+tex_cache.py
+------------
+
+Index of the SVG files compiled from TeX expressions in ``tex_dir``.
+
+The index is a small sqlite database kept next to the cached files.  It maps
+the hash of each expression to its SVG file, its size on disk and the time it
+was last used, so that the cache can be bounded in size by evicting the least
+recently used expressions.
+"""
+import os
+import sqlite3
+import time
+
+__all__ = ["TexCache"]
+
+INDEX_FILE_NAME = "tex_cache_index.sqlite3"
+INTERMEDIATE_EXTENSIONS = [".aux", ".log", ".dvi", ".xdv"]
+ENTRY_EXTENSIONS = [".svg", ".tex"]
+
+
+class TexCache:
+    """Size bounded, least recently used cache of compiled TeX expressions.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The directory holding the ``.tex`` and ``.svg`` files, i.e. ``tex_dir``.
+    max_size : :class:`float`, optional
+        The maximum total size of the cached files, in bytes.
+    """
+
+    def __init__(self, directory, max_size=float("inf")):
+        self.directory = directory
+        self.max_size = max_size
+        self.connection = sqlite3.connect(
+            os.path.join(directory, INDEX_FILE_NAME), timeout=30
+        )
+        # The index can always be rebuilt from the files, so don't wait for
+        # the disk on every write.
+        self.connection.execute("PRAGMA synchronous = OFF")
+        self.connection.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self.connection.commit()
+
+    def get_file_path(self, expression_hash, extension):
+        return os.path.join(self.directory, expression_hash + extension)
+
+    def get_svg_file(self, expression_hash):
+        """Return the SVG file of an expression, or None if it is not cached."""
+        row = self.connection.execute(
+            "SELECT hash FROM entries WHERE hash = ?", (expression_hash,)
+        ).fetchone()
+        if row is None:
+            return None
+        svg_file = self.get_file_path(expression_hash, ".svg")
+        if not os.path.exists(svg_file):
+            self.connection.execute(
+                "DELETE FROM entries WHERE hash = ?", (expression_hash,)
+            )
+            self.connection.commit()
+            return None
+        self.connection.execute(
+            "UPDATE entries SET last_access = ? WHERE hash = ?",
+            (time.time(), expression_hash),
+        )
+        self.connection.commit()
+        return svg_file
+
+    def add(self, expression_hash, remove_intermediate_files=True):
+        """Index an expression whose SVG file exists, then enforce the size limit.
+
+        Parameters
+        ----------
+        expression_hash : :class:`str`
+            The hash naming the ``.tex`` and ``.svg`` files of the expression.
+        remove_intermediate_files : :class:`bool`, optional
+            Whether to delete the ``.aux``, ``.log`` and ``.dvi`` files left by
+            the compilation.
+        """
+        if remove_intermediate_files:
+            self.remove_files(expression_hash, INTERMEDIATE_EXTENSIONS)
+        size = self.get_entry_size(expression_hash)
+        # Make room first, so the new expression is never evicted itself
+        self.evict(self.max_size - size)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+            (expression_hash, size, time.time()),
+        )
+        self.connection.commit()
+
+    def get_entry_size(self, expression_hash):
+        size = 0
+        for extension in ENTRY_EXTENSIONS:
+            file_path = self.get_file_path(expression_hash, extension)
+            if os.path.exists(file_path):
+                size += os.path.getsize(file_path)
+        return size
+
+    def remove_files(self, expression_hash, extensions):
+        for extension in extensions:
+            file_path = self.get_file_path(expression_hash, extension)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def get_total_size(self):
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    def evict(self, max_size=None):
+        """Remove the least recently used expressions until the cache fits.
+
+        Returns
+        -------
+        :class:`int`
+            The number of expressions removed.
+        """
+        max_size = self.max_size if max_size is None else max_size
+        total_size = self.get_total_size()
+        if total_size <= max_size:
+            return 0
+        rows = self.connection.execute(
+            "SELECT hash, size FROM entries ORDER BY last_access"
+        ).fetchall()
+        evicted = []
+        for expression_hash, size in rows:
+            if total_size <= max_size:
+                break
+            self.remove_files(
+                expression_hash, ENTRY_EXTENSIONS + INTERMEDIATE_EXTENSIONS
+            )
+            evicted.append((expression_hash,))
+            total_size -= size
+        self.connection.executemany("DELETE FROM entries WHERE hash = ?", evicted)
+        self.connection.commit()
+        return len(evicted)
+
+    def synchronize(self):
+        """Bring the index in line with the files in the directory.
+
+        SVG files that are not indexed yet (e.g. compiled before the index
+        existed) are added, using their modification time as last access, and
+        entries whose SVG file disappeared are dropped.
+        """
+        indexed = {
+            row[0] for row in self.connection.execute("SELECT hash FROM entries")
+        }
+        on_disk = set()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                stem, extension = os.path.splitext(entry.name)
+                if extension == ".svg":
+                    on_disk.add(stem)
+                    if stem not in indexed:
+                        self.connection.execute(
+                            "INSERT INTO entries VALUES (?, ?, ?)",
+                            (stem, self.get_entry_size(stem), entry.stat().st_mtime),
+                        )
+        self.connection.executemany(
+            "DELETE FROM entries WHERE hash = ?",
+            [(expression_hash,) for expression_hash in indexed - on_disk],
+        )
+        self.connection.commit()
+
+    def prune(self, max_size=None):
+        """Synchronize the index, delete intermediate files of every compiled
+        expression, evict down to ``max_size`` and compact the index.
+
+        Returns
+        -------
+        :class:`int`
+            The number of expressions removed.
+        """
+        self.synchronize()
+        for (expression_hash,) in self.connection.execute("SELECT hash FROM entries"):
+            self.remove_files(expression_hash, INTERMEDIATE_EXTENSIONS)
+        evicted = self.evict(max_size)
+        self.connection.execute("VACUUM")
+        return evicted
+
+    def get_stats(self):
+        """Return the number of indexed expressions and their total size in bytes."""
+        count, size = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return {"entries": count, "size": size, "max_size": self.max_size}
+
+    def close(self):
+        self.connection.close()
@@ -5,6 +5,12 @@ from pathlib import Path
 from .. import constants
 from ..config import file_writer_config, config
 from ..logger import logger
+from .tex_cache import TexCache
+
+# One index per tex_dir, since tex_dir can change between scenes
+_tex_caches = {}
+# Formats that could not be dumped, so compilation doesn't keep retrying them
+_failed_tex_formats = set()
 
 
 def tex_hash(expression):
@@ -15,18 +21,41 @@ def tex_hash(expression):
     return hasher.hexdigest()[:16]
 
 
+def get_tex_cache():
+    tex_dir = file_writer_config["tex_dir"]
+    if tex_dir not in _tex_caches:
+        max_size = file_writer_config["max_tex_cache_size"] * 1024 ** 2
+        _tex_caches[tex_dir] = TexCache(tex_dir, max_size)
+    return _tex_caches[tex_dir]
+
+
 def tex_to_svg_file(expression, source_type):
     tex_template = config["tex_template"]
+    expression_hash = tex_hash(get_tex_source(expression, tex_template, source_type))
+    tex_cache = get_tex_cache()
+    svg_file = tex_cache.get_svg_file(expression_hash)
+    if svg_file is not None:
+        return svg_file
+
     tex_file = generate_tex_file(expression, tex_template, source_type)
-    dvi_file = tex_to_dvi(tex_file, tex_template.use_ctex)
-    return dvi_to_svg(dvi_file, use_ctex=tex_template.use_ctex)
+    # Only clean up after compilations done here, not files found on disk
+    compiled = not os.path.exists(tex_file.replace(".tex", ".svg"))
+    dvi_file = tex_to_dvi(tex_file, tex_template.use_ctex, tex_template)
+    svg_file = dvi_to_svg(dvi_file, use_ctex=tex_template.use_ctex)
+    if os.path.exists(svg_file):
+        tex_cache.add(expression_hash, remove_intermediate_files=compiled)
+    return svg_file
 
 
-def generate_tex_file(expression, tex_template, source_type):
+def get_tex_source(expression, tex_template, source_type):
     if source_type == "text":
-        output = tex_template.get_text_for_text_mode(expression)
+        return tex_template.get_text_for_text_mode(expression)
     elif source_type == "tex":
-        output = tex_template.get_text_for_tex_mode(expression)
+        return tex_template.get_text_for_tex_mode(expression)
+
+
+def generate_tex_file(expression, tex_template, source_type):
+    output = get_tex_source(expression, tex_template, source_type)
 
     result = os.path.join(file_writer_config["tex_dir"], tex_hash(output)) + ".tex"
     if not os.path.exists(result):
@@ -36,35 +65,86 @@ def generate_tex_file(expression, tex_template, source_type):
     return result
 
 
-def tex_to_dvi(tex_file, use_ctex=False):
+def get_tex_format(tex_template):
+    """Returns the precompiled format of the template's preamble, dumping it
+    into tex_dir the first time.
+
+    The format is dumped with mylatexformat, which makes TeX skip the preamble
+    of any document compiled with it, so the .tex files themselves are
+    unchanged.  Returns None if preloading is disabled or dumping failed.
+    """
+    if not file_writer_config["preload_tex_format"]:
+        return None
+    engine = "xelatex" if tex_template.use_ctex else "latex"
+    format_name = tex_hash(engine + tex_template.get_preamble()) + "_format"
+    # kpathsea only finds formats outside of its search path by absolute path
+    tex_dir = Path(os.path.abspath(file_writer_config["tex_dir"])).as_posix()
+    tex_format = f"{tex_dir}/{format_name}"
+    if os.path.exists(tex_format + ".fmt"):
+        return tex_format
+    if tex_format in _failed_tex_formats:
+        return None
+
+    preamble_file = tex_format + ".tex"
+    with open(preamble_file, "w", encoding="utf-8") as outfile:
+        outfile.write(tex_template.get_preamble())
+        outfile.write("\n\\begin{document}\n\\end{document}\n")
+    commands = [
+        engine,
+        "-ini",
+        "-interaction=batchmode",
+        "-halt-on-error",
+        '-jobname="{}"'.format(format_name),
+        '-output-directory="{}"'.format(tex_dir),
+        '"&{}"'.format(engine),
+        "mylatexformat.ltx",
+        '"{}"'.format(preamble_file),
+        ">",
+        os.devnull,
+    ]
+    exit_code = os.system(" ".join(commands))
+    if exit_code != 0 or not os.path.exists(tex_format + ".fmt"):
+        logger.debug(
+            f"Could not dump the TeX format {tex_format}.fmt, "
+            "compiling with the full preamble instead."
+        )
+        _failed_tex_formats.add(tex_format)
+        return None
+    return tex_format
+
+
+def tex_compilation_commands(tex_file, tex_dir, use_ctex=False, tex_format=None):
+    commands = (
+        ["latex", "-interaction=batchmode", "-halt-on-error",]
+        if not use_ctex
+        else ["xelatex", "-no-pdf", "-interaction=batchmode", "-halt-on-error",]
+    )
+    if tex_format is not None:
+        commands.append('-fmt="{}"'.format(tex_format))
+    commands += [
+        '-output-directory="{}"'.format(tex_dir),
+        '"{}"'.format(tex_file),
+        ">",
+        os.devnull,
+    ]
+    return commands
+
+
+def tex_to_dvi(tex_file, use_ctex=False, tex_template=None):
     result = tex_file.replace(".tex", ".dvi" if not use_ctex else ".xdv")
     result = Path(result).as_posix()
     tex_file = Path(tex_file).as_posix()
     tex_dir = Path(file_writer_config["tex_dir"]).as_posix()
     if not os.path.exists(result):
-        commands = (
-            [
-                "latex",
-                "-interaction=batchmode",
-                "-halt-on-error",
-                '-output-directory="{}"'.format(tex_dir),
-                '"{}"'.format(tex_file),
-                ">",
-                os.devnull,
-            ]
-            if not use_ctex
-            else [
-                "xelatex",
-                "-no-pdf",
-                "-interaction=batchmode",
-                "-halt-on-error",
-                '-output-directory="{}"'.format(tex_dir),
-                '"{}"'.format(tex_file),
-                ">",
-                os.devnull,
-            ]
-        )
+        tex_format = None
+        if tex_template is not None:
+            tex_format = get_tex_format(tex_template)
+        commands = tex_compilation_commands(tex_file, tex_dir, use_ctex, tex_format)
         exit_code = os.system(" ".join(commands))
+        if exit_code != 0 and tex_format is not None:
+            # Don't let a problem with the format hide a working compilation
+            commands = tex_compilation_commands(tex_file, tex_dir, use_ctex)
+            exit_code = os.system(" ".join(commands))
         if exit_code != 0:
             log_file = tex_file.replace(".tex", ".log")
             raise Exception(
@@ -0,0 +1,28 @@
+import os
+
+from test_cli import capture
+
+this_folder = os.path.dirname(__file__)
+
+
+def test_cache_help(python_version):
+    """Test if Manim successfully adds the cache subparser when the subcommand is invoked."""
+    command = f"cd {this_folder} && {python_version} -m manim cache --help"
+    out, err, exitcode = capture(command, use_shell=True)
+    assert (
+        exitcode == 0
+    ), f"The cache subcommand help is not working as intended.\nError : {err}"
+
+
+def test_cache_stats(python_version):
+    """Test if the `manim cache stats` command works as intended."""
+    command = f"cd {this_folder} && {python_version} -m manim cache stats"
+    out, err, exitcode = capture(command, use_shell=True)
+    assert exitcode == 0, err
+
+
+def test_cache_prune(python_version):
+    """Test if the `manim cache prune` command works as intended."""
+    command = f"cd {this_folder} && {python_version} -m manim cache prune --max_size 0"
+    out, err, exitcode = capture(command, use_shell=True)
+    assert exitcode == 0, err
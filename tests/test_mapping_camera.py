@@ -0,0 +1,44 @@
+import numpy as np
+
+from manim import RIGHT, Square
+from manim.camera.mapping_camera import MappingCamera
+
+
+def test_vectorized_mapping_func():
+    """Test that a vectorized mapping_func is called once with all the points."""
+    calls = []
+
+    def mapping_func(points):
+        calls.append(points.shape)
+        return 2 * points
+
+    points = np.arange(12, dtype=float).reshape((4, 3))
+    camera = MappingCamera(mapping_func=mapping_func, vectorized_mapping_func=True)
+    np.testing.assert_allclose(camera.map_points(points), 2 * points)
+    assert calls == [(4, 3)]
+
+    # By default, it is called once per point
+    calls.clear()
+    camera = MappingCamera(mapping_func=mapping_func)
+    np.testing.assert_allclose(camera.map_points(points), 2 * points)
+    assert calls == [(3,)] * 4
+
+
+def test_subdivided_points_cache():
+    """Test that subdivided points are reused until the points change."""
+    camera = MappingCamera(min_num_curves=20)
+    square = Square()
+    assert camera.needs_subdivision(square)
+    subdivided = camera.get_subdivided_points(square)
+    num_curves = square.get_num_curves() + 20
+    assert len(subdivided) == num_curves * square.n_points_per_cubic_curve
+    assert camera.get_subdivided_points(square) is subdivided
+
+    square.shift(RIGHT)
+    shifted = camera.get_subdivided_points(square)
+    assert shifted is not subdivided
+    np.testing.assert_allclose(shifted, subdivided + RIGHT, atol=1e-10)
+
+    square.points[:] = 0
+    square.note_changed_points()
+    np.testing.assert_allclose(camera.get_subdivided_points(square), 0)
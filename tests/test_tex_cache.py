@@ -0,0 +1,120 @@
+import itertools
+import os
+
+import pytest
+
+from manim.utils import tex_cache
+from manim.utils.tex_cache import TexCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """A TexCache in a temporary directory, whose clock ticks once per call."""
+    clock = itertools.count(1000)
+    monkeypatch.setattr(tex_cache.time, "time", lambda: float(next(clock)))
+    cache = TexCache(str(tmp_path))
+    yield cache
+    cache.close()
+
+
+def write_expression(directory, expression_hash, svg_size=100, tex_size=10):
+    """Write the files a compilation leaves for an expression."""
+    for extension, size in [".svg", svg_size], [".tex", tex_size]:
+        with open(os.path.join(directory, expression_hash + extension), "w") as f:
+            f.write("x" * size)
+    for extension in tex_cache.INTERMEDIATE_EXTENSIONS:
+        with open(os.path.join(directory, expression_hash + extension), "w") as f:
+            f.write("x")
+
+
+def test_add(cache):
+    """Test that add indexes the SVG and TeX files and removes the others."""
+    write_expression(cache.directory, "a")
+    cache.add("a")
+    assert cache.get_stats() == {"entries": 1, "size": 110, "max_size": float("inf")}
+    assert cache.get_svg_file("a") == os.path.join(cache.directory, "a.svg")
+    assert sorted(os.listdir(cache.directory)) == [
+        "a.svg",
+        "a.tex",
+        tex_cache.INDEX_FILE_NAME,
+    ]
+    assert cache.get_svg_file("b") is None
+
+
+def test_add_keeps_intermediate_files(cache):
+    write_expression(cache.directory, "a")
+    cache.add("a", remove_intermediate_files=False)
+    assert os.path.exists(os.path.join(cache.directory, "a.log"))
+
+
+def test_evict_least_recently_used(cache):
+    """Test that evict removes the expressions used least recently first."""
+    for expression_hash in "abc":
+        write_expression(cache.directory, expression_hash)
+        cache.add(expression_hash)
+    # Using "a" makes "b" the least recently used expression
+    assert cache.get_svg_file("a") is not None
+
+    assert cache.evict(220) == 1
+    assert cache.get_svg_file("b") is None
+    assert not os.path.exists(os.path.join(cache.directory, "b.svg"))
+    assert not os.path.exists(os.path.join(cache.directory, "b.tex"))
+
+    assert cache.evict(110) == 1
+    assert cache.get_svg_file("c") is None
+    assert cache.get_svg_file("a") is not None
+    assert cache.get_stats()["size"] == 110
+
+
+def test_add_evicts_to_max_size(tmp_path):
+    cache = TexCache(str(tmp_path), max_size=250)
+    for expression_hash in "abc":
+        write_expression(cache.directory, expression_hash)
+        cache.add(expression_hash)
+    # The new expression itself is never evicted
+    assert cache.get_svg_file("c") is not None
+    assert cache.get_stats()["entries"] == 2
+    cache.close()
+
+
+def test_synchronize(cache):
+    """Test that synchronize picks up the files added or removed behind the index."""
+    write_expression(cache.directory, "a")
+    cache.add("a")
+    write_expression(cache.directory, "b", svg_size=50)
+    os.remove(os.path.join(cache.directory, "a.svg"))
+
+    cache.synchronize()
+    assert cache.get_stats()["entries"] == 1
+    assert cache.get_stats()["size"] == 60
+    assert cache.get_svg_file("a") is None
+    assert cache.get_svg_file("b") == os.path.join(cache.directory, "b.svg")
+
+
+def test_prune(cache):
+    """Test that prune removes intermediate files and evicts down to max_size."""
+    for expression_hash in "abc":
+        write_expression(cache.directory, expression_hash)
+        cache.add(expression_hash, remove_intermediate_files=False)
+    # An expression compiled before the index existed
+    write_expression(cache.directory, "d")
+
+    assert cache.prune(max_size=250) == 2
+    assert cache.get_stats()["entries"] == 2
+    remaining = sorted(os.listdir(cache.directory))
+    remaining.remove(tex_cache.INDEX_FILE_NAME)
+    assert remaining == ["c.svg", "c.tex", "d.svg", "d.tex"]
+
+    assert cache.prune(max_size=0) == 2
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_get_stats(tmp_path):
+    cache = TexCache(str(tmp_path), max_size=1000)
+    assert cache.get_stats() == {"entries": 0, "size": 0, "max_size": 1000}
+    write_expression(cache.directory, "a", svg_size=30, tex_size=5)
+    cache.add("a")
+    write_expression(cache.directory, "b", svg_size=70, tex_size=5)
+    cache.add("b")
+    assert cache.get_stats() == {"entries": 2, "size": 110, "max_size": 1000}
+    cache.close()
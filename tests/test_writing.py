@@ -29,5 +29,14 @@ class TexMobjectTest(Scene):
         self.play(Animation(t))
 
 
+def test_text_spaces_are_invisible():
+    """Test that the rectangles standing for leading and trailing spaces
+    don't take the color of the text."""
+    t = Text("  a  ")
+    assert t[0].get_fill_opacity() == 0
+    assert t[-1].get_fill_opacity() == 0
+    assert t[0].get_stroke_opacity() == 0
+
+
 def test_scenes():
     utils_test_scenes(get_scenes_to_test(__name__), "writing", caching_needed=True)
@@ -40,9 +40,6 @@ class SceneTester:
         self.path_tests_data = os.path.join("tests", "tests_data", module_tested)
 
         if caching_needed:
-            file_writer_config["text_dir"] = os.path.join(
-                self.path_tests_medias_cache, scene_object.__name__, "Text"
-            )
             file_writer_config["tex_dir"] = os.path.join(
                 self.path_tests_medias_cache, scene_object.__name__, "Tex"
             )
@@ -55,6 +52,8 @@ class SceneTester:
         config["frame_rate"] = 15
         # By invoking this, the scene is rendered.
         self.scene = scene_object()
+        # Skipped animations compute no frame, so render the final state
+        self.scene.update_frame()
 
     def load_data(self):
         """Load the np.array of the last frame of a pre-rendered scene. If not found, throw FileNotFoundError.
@@ -140,6 +139,7 @@ def set_test_scene(scene_object, module_name):
     config["frame_rate"] = 15
 
     scene = scene_object()
+    scene.update_frame()
     data = scene.get_frame()
     path = os.path.join("manim", "tests", "tests_data", "{}".format(module_name))
     if not os.path.isdir(path):